@@ -1,20 +1,18 @@
 import time
 import json
 import logging
-import sys
+import logging.handlers
 from pathlib import Path
 from typing import Optional
-from datetime import datetime
-
-# Ensure project root is on sys.path when running this module directly
-_THIS_FILE = Path(__file__).resolve()
-_PROJECT_ROOT = _THIS_FILE.parent.parent
-if str(_PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(_PROJECT_ROOT))
 
 import httpx
 import asyncio
 import atexit
+import collections
+import functools
+import queue
+import threading
+import weakref
 
 """API client utilities for PingOne interactions.
 
@@ -24,6 +22,28 @@ toggle for detailed API logging, and offers a simple connection-level
 log writer the UI can display for debugging.
 """
 
+# Optional fast JSON codec: orjson is a compiled extension several times
+# faster than stdlib json for both encode and decode, and emits bytes
+# directly. Fall back to stdlib when it is not installed.
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+if orjson is not None:
+    def _json_dumps_bytes(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    def _json_loads(raw):
+        return orjson.loads(raw)
+else:
+    def _json_dumps_bytes(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def _json_loads(raw):
+        return json.loads(raw)
+
+
 # --- 0. METADATA ---
 LOG_FILE = Path("api_calls.log")
 
@@ -38,7 +58,24 @@ API_LOGGING_ENABLED = False
 
 # Live capture controls for UI-driven capture sessions
 LIVE_CAPTURE_ENABLED = False
-_LIVE_EVENTS = []
+# Bounded buffer: appends are O(1) and old events are evicted
+# automatically if the UI stops polling, so a long bulk run cannot grow
+# the buffer without limit.
+_LIVE_EVENTS = collections.deque(maxlen=10000)
+# Guards _LIVE_EVENTS: events are appended both from async handlers and
+# from the background connection-log writer thread.
+_LIVE_EVENTS_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=2)
+def _utc_stamp(second: int) -> str:
+    """ISO timestamp for the given whole second; cached so per-event
+    formatting costs a dict lookup rather than datetime formatting.
+
+    time.strftime over gmtime is markedly cheaper than building a
+    datetime object and calling isoformat(), and the cache amortizes it
+    across all messages logged within the same second."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second)) + "Z"
 
 def enable_live_capture(enabled: bool):
     global LIVE_CAPTURE_ENABLED
@@ -48,29 +85,87 @@ def enable_live_capture(enabled: bool):
     except Exception:
         pass
 
+# Optional callable invoked (from whatever thread produced the event)
+# each time a live event is appended. The UI registers one so it can be
+# notified push-style instead of polling the buffer on a timer; the
+# listener is responsible for marshaling onto its own thread.
+_live_event_listener = None
+
+def set_live_event_listener(listener):
+    """Register a callable notified with each live event string (or None)."""
+    global _live_event_listener
+    _live_event_listener = listener
+
 def append_live_event(message: str):
     try:
         if LIVE_CAPTURE_ENABLED:
-            _LIVE_EVENTS.append(f"{datetime.utcnow().isoformat()}Z {message}")
+            entry = f"{_utc_stamp(int(time.time()))} {message}"
+            with _LIVE_EVENTS_LOCK:
+                _LIVE_EVENTS.append(entry)
+            listener = _live_event_listener
+            if listener is not None:
+                listener(entry)
     except Exception:
         pass
 
 def get_and_clear_live_events() -> list:
-    global _LIVE_EVENTS
-    ev = list(_LIVE_EVENTS)
-    _LIVE_EVENTS = []
+    with _LIVE_EVENTS_LOCK:
+        ev = list(_LIVE_EVENTS)
+        _LIVE_EVENTS.clear()
     return ev
 
 
+# Buffered handlers attached below, kept so flush_logs() can push their
+# pending records to disk on demand (the UI reads these files live).
+_BUFFERED_HANDLERS = []
+
+
+def _add_buffered_file_handler(logger, log_file: Path):
+    """Attach a MemoryHandler-buffered FileHandler to `logger`.
+
+    Plain FileHandlers issue one write() per record, which dominates CPU
+    under bulk operations. Buffering up to 1024 records (flushed early on
+    ERROR and at exit) batches those writes into large chunks.
+    """
+    handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+    handler.setFormatter(formatter)
+    buffered = logging.handlers.MemoryHandler(
+        capacity=1024, flushLevel=logging.ERROR, target=handler, flushOnClose=True
+    )
+    logger.addHandler(buffered)
+    _BUFFERED_HANDLERS.append(buffered)
+    atexit.register(buffered.close)
+    atexit.register(buffered.flush)
+
+
+def flush_logs() -> None:
+    """Flush buffered log records and the connection-log handle to disk.
+
+    Log writes are batched for throughput, so the files can lag behind
+    what the app has logged. The UI calls this before showing,
+    archiving or resetting log files so their on-disk content is
+    current.
+    """
+    for buffered in _BUFFERED_HANDLERS:
+        try:
+            buffered.flush()
+        except Exception:
+            pass
+    fh = _conn_log_fh
+    if fh is not None and not fh.closed:
+        try:
+            fh.flush()
+        except Exception:
+            pass
+
+
 def init_logger():
     """Initialize logger for API calls."""
     logger = logging.getLogger("PingOneAPI")
     logger.setLevel(logging.DEBUG)
     if not logger.handlers:
-        handler = logging.FileHandler(LOG_FILE, mode='a', encoding='utf-8')
-        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        _add_buffered_file_handler(logger, LOG_FILE)
     return logger
 
 
@@ -86,10 +181,7 @@ def init_credential_logger():
     logger = logging.getLogger("PingOneCredentials")
     logger.setLevel(logging.INFO)
     if not logger.handlers:
-        handler = logging.FileHandler(CREDENTIALS_LOG, mode='a', encoding='utf-8')
-        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        _add_buffered_file_handler(logger, CREDENTIALS_LOG)
     return logger
 
 
@@ -116,9 +208,65 @@ def set_credentials_log_level(level_name: str):
         pass
 
 
-# Note: AsyncClient instances should not be shared across threads or
-# event loops. Create short-lived AsyncClient instances per async
-# operation (using `async with`) to avoid unsafe concurrent reuse.
+# Connection pooling: each PingOneClient keeps one long-lived AsyncClient
+# so sequential calls (token refresh, bulk creates/updates) reuse warm
+# TCP+TLS connections instead of paying a new handshake per request.
+# AsyncClient instances are bound to the event loop that created them, and
+# workers run their own loops via asyncio.run(), so the client is created
+# lazily per loop and rebuilt if it is used from a different loop.
+
+# Module-level registry of AsyncClients so shutdown can close any that
+# are still open. Weak references keep the registry from pinning clients
+# alive: once the owning PingOneClient (and its worker loop) is gone the
+# entry disappears and the client can be reclaimed, so short-lived
+# operations do not accumulate pooled clients until exit.
+_OPEN_ASYNC_CLIENTS = weakref.WeakSet()
+
+_POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+# Advertise response compression so large list endpoints arrive
+# compressed (httpx decompresses transparently). Brotli is only offered
+# when the codec is importable, matching other optional dependencies.
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "br, gzip, deflate"
+except Exception:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
+
+def _register_async_client(client) -> None:
+    _OPEN_ASYNC_CLIENTS.add(client)
+
+
+class _RetryAfterTransport(httpx.AsyncHTTPTransport):
+    """Transport adding bounded retries for throttled/unavailable responses.
+
+    Connect-level retries come from the base transport (`retries=`);
+    this wrapper additionally retries 429/503 responses, honoring the
+    server's Retry-After header and falling back to exponential backoff.
+    Retrying at the transport keeps the pooled connection warm and means
+    every client method benefits without per-call sleep loops.
+    """
+
+    _RETRY_STATUS = frozenset({429, 503})
+
+    def __init__(self, max_retries: int = 3, **kwargs):
+        super().__init__(**kwargs)
+        self._max_retries = max_retries
+
+    async def handle_async_request(self, request):
+        response = await super().handle_async_request(request)
+        for attempt in range(self._max_retries):
+            if response.status_code not in self._RETRY_STATUS:
+                break
+            try:
+                delay = float(response.headers.get("Retry-After"))
+            except (TypeError, ValueError):
+                delay = min(2.0 ** attempt, 10.0)
+            await response.aclose()
+            await asyncio.sleep(delay)
+            response = await super().handle_async_request(request)
+        return response
 
 
 def set_api_logging(enabled: bool):
@@ -139,31 +287,108 @@ def set_api_logging(enabled: bool):
 
 
 def close_async_client() -> None:
-    """Compatibility helper: previously the module exposed a function to
-    synchronously close a shared AsyncClient. The client was changed to
-    use short-lived AsyncClient instances per operation; keep a no-op
-    function so callers (e.g. `app.aboutToQuit.connect`) continue to work.
+    """Close any AsyncClients that are still open.
+
+    Wired to `app.aboutToQuit` so pooled connections are torn down
+    cleanly on exit. Clients created in worker event loops that have
+    already finished may fail to close; those failures are ignored.
     """
+    while True:
+        try:
+            client = _OPEN_ASYNC_CLIENTS.pop()
+        except KeyError:
+            break
+        if client.is_closed:
+            continue
+        try:
+            asyncio.run(client.aclose())
+        except Exception:
+            pass
     try:
-        api_logger.info("close_async_client called (no-op)")
+        api_logger.info("close_async_client: closed pooled clients")
     except Exception:
         pass
 
 
+# Buffered handle for the connection log. Opening/writing/closing the file
+# on every message costs three syscalls per line; keeping one append-mode
+# handle with a 64KB buffer batches writes and flushes at exit.
+_conn_log_fh = None
+
+
+def _get_conn_log_fh():
+    global _conn_log_fh
+    if _conn_log_fh is None or _conn_log_fh.closed:
+        _conn_log_fh = open(CONNECTION_LOG, "a", buffering=65536, encoding="utf-8")
+        atexit.register(_conn_log_fh.close)
+    return _conn_log_fh
+
+
+# Connection-log writes happen inside async HTTP handlers, so a slow disk
+# would stall the event loop. Messages are queued and a background daemon
+# thread performs the actual buffered writes; callers only pay a
+# put_nowait.
+_conn_log_queue = queue.SimpleQueue()
+_conn_log_thread = None
+_CONN_LOG_STOP = object()
+
+
+def _conn_log_writer():
+    while True:
+        item = _conn_log_queue.get()
+        if item is _CONN_LOG_STOP:
+            break
+        try:
+            fh = _get_conn_log_fh()
+            fh.write(item)
+            # Flush once the queue drains so the file catches up whenever
+            # logging goes idle; under sustained load the 64KB buffer
+            # still batches writes between drains.
+            if _conn_log_queue.empty():
+                fh.flush()
+        except Exception:
+            pass
+
+
+def _stop_conn_log_writer():
+    _conn_log_queue.put(_CONN_LOG_STOP)
+    if _conn_log_thread is not None:
+        _conn_log_thread.join(timeout=2.0)
+
+
+def _ensure_conn_log_writer():
+    global _conn_log_thread
+    if _conn_log_thread is None or not _conn_log_thread.is_alive():
+        _conn_log_thread = threading.Thread(target=_conn_log_writer, name="conn-log-writer", daemon=True)
+        _conn_log_thread.start()
+        atexit.register(_stop_conn_log_writer)
+
+
+# Pre-built connection-log message templates. Percent-interpolating a
+# cached template avoids re-expanding f-string bytecode per call in the
+# bulk create/update loops that can emit thousands of lines per second.
+_TMPL_REQ = "%s %s - Request: %s"
+_TMPL_RESP = "%s %s - %s - Response: %s"
+_TMPL_ERR = "%s %s - ERROR - %s"
+_TMPL_OP_FAILED = "%s FAILED for user=%s - Request: %s - Response: %s"
+
+
 def write_connection_log(message: str):
     """Append a connection-related message to `connection_errors.log`.
 
     This is used for both error traces and (optionally) for recording
     API request/response pairs when debugging connections.
 
-    The function is intentionally simple and tolerant of IO errors so
-    it will not interfere with normal app operation.
+    The actual file write happens on a background thread; this function
+    only timestamps the message and enqueues it, so it is safe to call
+    from async code. It remains tolerant of errors so logging can never
+    interfere with normal app operation.
     """
     try:
         # Use UTC timestamp so logs are consistent regardless of user timezone
-        ts = datetime.utcnow().isoformat() + "Z"
-        with open(CONNECTION_LOG, "a", encoding="utf-8") as f:
-            f.write(f"[{ts}] {message}\n")
+        ts = _utc_stamp(int(time.time()))
+        _ensure_conn_log_writer()
+        _conn_log_queue.put_nowait(f"[{ts}] {message}\n")
         # Also append to live capture buffer when enabled
         try:
             append_live_event(message)
@@ -175,43 +400,216 @@ def write_connection_log(message: str):
 
 
 
+def _truncate(text: str, limit: int = 2000) -> str:
+    """Trim `text` to `limit` characters with an ellipsis marker."""
+    if len(text) > limit:
+        return text[:limit] + '...'
+    return text
+
+
+def _preview(data, limit: int = 2000) -> str:
+    """Serialize a payload once for logging, truncated to `limit` chars.
+
+    The same request dict was previously json.dumps-ed separately for
+    the live event, request log, and failure-path connection log; this
+    produces a single compact preview that all log branches share.
+    """
+    try:
+        text = _json_dumps_bytes(data).decode("utf-8") if isinstance(data, (dict, list)) else str(data)
+    except Exception:
+        text = str(data)
+    return _truncate(text, limit)
+
+
+# Compiled JSON Schema validator cache keyed by the schema file's mtime.
+# jsonschema.validate() recompiles the schema on every call; a persistent
+# validator instance makes per-row validation in bulk imports cheap.
+_VALIDATOR_CACHE = None
+
+
+def _get_schema_validator():
+    """Return a compiled validator for `user_schema.json`, or None.
+
+    None means local validation should be skipped (jsonschema not
+    installed or no schema file). The validator is rebuilt if the schema
+    file's mtime changes.
+    """
+    global _VALIDATOR_CACHE
+    try:
+        import jsonschema
+    except Exception:
+        # jsonschema not installed; skip local validation
+        return None
+    schema_file = Path(__file__).resolve().parent.parent / 'user_schema.json'
+    try:
+        mtime = schema_file.stat().st_mtime
+    except OSError:
+        return None
+    if _VALIDATOR_CACHE is None or _VALIDATOR_CACHE[0] != mtime:
+        with open(schema_file, 'r', encoding='utf-8') as f:
+            schema = json.load(f)
+        _VALIDATOR_CACHE = (mtime, jsonschema.Draft7Validator(schema))
+    return _VALIDATOR_CACHE[1]
+
+
 class PingOneClient:
     """Client for interacting with PingOne API."""
+
+    # Slots cut per-instance memory (no __dict__) and make attribute
+    # access a C-level slot lookup; every attribute is assigned in
+    # __init__ since the URLs are precomputed there anyway.
+    __slots__ = (
+        'env_id', 'client_id', 'client_secret', 'base_url',
+        '_users_url', '_populations_url', '_auth_url',
+        '_basic_auth', '_token_body',
+        '_token', '_token_expires', '_headers', '_headers_token',
+        '_client', '_client_loop',
+        '_token_lock', '_token_lock_loop', '_refresher', '_refresher_loop',
+    )
+
     def __init__(self, env_id: str, client_id: str, client_secret: str):
         self.env_id = env_id
         self.client_id = client_id
         self.client_secret = client_secret
         self.base_url = f"https://api.pingone.com/v1/environments/{env_id}"
+        # Endpoint URLs are constant per client; build them once instead
+        # of re-evaluating f-strings on every request.
+        self._users_url = f"{self.base_url}/users"
+        self._populations_url = f"{self.base_url}/populations"
+        self._auth_url = f"https://auth.pingone.com/{env_id}/as/token"
+        # Credentials are immutable per client: prebuild the BasicAuth
+        # object (avoids a base64 encode per token request) and the
+        # client-credentials form body.
+        self._basic_auth = httpx.BasicAuth(client_id, client_secret)
+        self._token_body = {"grant_type": "client_credentials"}
         self._token: Optional[str] = None
         self._token_expires = 0
+        # Cached auth headers, rebuilt only when the token changes.
+        self._headers: Optional[dict] = None
+        self._headers_token: Optional[str] = None
+        # Shared pooled AsyncClient, created lazily per event loop.
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop = None
+        # Token refresh coordination: the lock serializes concurrent
+        # refreshes and the background task renews the token before it
+        # expires. Both are loop-bound, so they are created lazily per
+        # event loop like the pooled client.
+        self._token_lock: Optional[asyncio.Lock] = None
+        self._token_lock_loop = None
+        self._refresher = None
+        self._refresher_loop = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled AsyncClient for the current event loop.
+
+        The client is created on first use and rebuilt if this
+        PingOneClient is used from a different event loop (workers run
+        their own loops via `asyncio.run`). One client serves both the
+        auth and API hosts; httpx pools connections per origin.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            old = self._client
+            if old is not None and not old.is_closed:
+                # Close and unregister the replaced client rather than
+                # leaving it (and its pooled connections) to linger until
+                # app exit. Its connections belong to a previous loop, so
+                # the close is best-effort.
+                _OPEN_ASYNC_CLIENTS.discard(old)
+                try:
+                    loop.create_task(old.aclose())
+                except Exception:
+                    pass
+            self._client = httpx.AsyncClient(
+                timeout=10.0,
+                limits=_POOL_LIMITS,
+                headers={"Accept-Encoding": _ACCEPT_ENCODING},
+                transport=_RetryAfterTransport(max_retries=3, retries=3),
+            )
+            self._client_loop = loop
+            _register_async_client(self._client)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled AsyncClient (if one was created)."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
 
     def _get_auth_headers(self, token: str) -> dict:
         """Helper method to create authorization headers."""
         # Centralize header creation so any future global headers (e.g.
-        # Accept, tracing IDs) are added in a single place.
-        return {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+        # Accept, tracing IDs) are added in a single place. The token only
+        # changes on refresh, so the dict is built once per token instead
+        # of being reallocated on every request.
+        if self._headers is None or self._headers_token != token:
+            self._headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+            self._headers_token = token
+        return self._headers
+
+    def _get_token_lock(self) -> asyncio.Lock:
+        """Return the token refresh lock for the current event loop."""
+        loop = asyncio.get_running_loop()
+        if self._token_lock is None or self._token_lock_loop is not loop:
+            self._token_lock = asyncio.Lock()
+            self._token_lock_loop = loop
+        return self._token_lock
+
+    def _ensure_refresher(self) -> None:
+        """Start the background token refresh task on the current loop."""
+        loop = asyncio.get_running_loop()
+        if self._refresher is None or self._refresher.done() or self._refresher_loop is not loop:
+            self._refresher = loop.create_task(self._token_refresh_loop())
+            self._refresher_loop = loop
+
+    async def _token_refresh_loop(self) -> None:
+        """Renew the token shortly before it expires.
+
+        Keeps user-facing calls on the fast path (cached token) instead
+        of paying the OAuth round trip inline when the token lapses.
+        Worker loops are short-lived; when they exit the task is simply
+        cancelled with them.
+        """
+        while True:
+            delay = self._token_expires - time.monotonic() - 120
+            await asyncio.sleep(delay if delay > 0 else 60)
+            async with self._get_token_lock():
+                await self._fetch_token()
 
     async def get_token(self) -> Optional[str]:
         """Retrieve and cache access token for API authentication."""
-        now = time.time()
-        if self._token and now < self._token_expires:
+        if self._token and time.monotonic() < self._token_expires:
             return self._token
 
-        auth_url = f"https://auth.pingone.com/{self.env_id}/as/token"
+        async with self._get_token_lock():
+            # Another caller may have refreshed while we waited.
+            if self._token and time.monotonic() < self._token_expires:
+                return self._token
+            token = await self._fetch_token()
+        if token:
+            self._ensure_refresher()
+        return token
+
+    async def _fetch_token(self) -> Optional[str]:
+        """Perform the OAuth client-credentials POST and cache the result."""
+        # Monotonic clock: immune to wall-clock adjustments, so an NTP
+        # jump can neither force a refresh storm nor extend a stale token.
+        now = time.monotonic()
+        auth_url = self._auth_url
         # Execute the HTTP token request; callers rely on `None` return
         # value to indicate that authentication failed.
         try:
-            append_live_event(f"TOKEN POST {auth_url}")
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                resp = await client.post(
-                    auth_url,
-                    data={"grant_type": "client_credentials"},
-                    auth=(self.client_id, self.client_secret),
-                )
+            if LIVE_CAPTURE_ENABLED:
+                append_live_event(f"TOKEN POST {auth_url}")
+            client = self._get_client()
+            resp = await client.post(
+                auth_url,
+                data=self._token_body,
+                auth=self._basic_auth,
+            )
             resp.raise_for_status()
-            data = resp.json()
+            data = _json_loads(resp.content)
             self._token = data.get("access_token")
-            self._token_expires = now + data.get("expires_in", 3600) - 60
+            self._token_expires = int(now) + int(data.get("expires_in", 3600)) - 60
 
             # Always log credential-related events (without secrets) to the
             # credential logger if enabled. API logging remains separate.
@@ -250,59 +648,58 @@ class PingOneClient:
         if not token:
             raise Exception("Auth Failed. Check credentials.")
         headers = self._get_auth_headers(token)
-        update_url = f"{self.base_url}/users/{user_id}"
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            try:
-                # Optionally record request body/URL
-                if API_LOGGING_ENABLED:
-                    api_logger.info(f"PUT {update_url} - Request body: {json.dumps(data)}")
+        update_url = self._users_url + "/" + user_id
+        client = self._get_client()
+        # Only serialize the payload when something will actually log it;
+        # with logging off the common path skips all string building.
+        req_preview = _preview(data) if API_LOGGING_ENABLED else None
+        try:
+            # Optionally record request body/URL
+            if API_LOGGING_ENABLED:
+                api_logger.info(f"PUT {update_url} - Request body: {req_preview}")
+                if LIVE_CAPTURE_ENABLED:
                     append_live_event(f"PUT {update_url}")
-                    write_connection_log(f"PUT {update_url} - Request: {json.dumps(data)}")
+                write_connection_log(_TMPL_REQ % ("PUT", update_url, req_preview))
 
-                resp = await client.put(update_url, headers=headers, json=data)
+            resp = await client.put(update_url, headers=headers, content=_json_dumps_bytes(data))
+            try:
+                resp.raise_for_status()
+            except httpx.HTTPStatusError as he:
+                # Include response body for diagnostics
+                body = None
+                try:
+                    body = he.response.text
+                except Exception:
+                    body = str(he)
+                msg = f"{str(he)} - Response: {body}"
+                # Log the failing update including request body for debugging
                 try:
-                    resp.raise_for_status()
-                except httpx.HTTPStatusError as he:
-                    # Include response body for diagnostics
-                    body = None
-                    try:
-                        body = he.response.text
-                    except Exception:
-                        body = str(he)
-                    msg = f"{str(he)} - Response: {body}"
-                    # Log the failing update including request body for debugging
-                    try:
-                        short_req = json.dumps(data) if isinstance(data, (dict, list)) else str(data)
-                        if len(short_req) > 2000:
-                            short_req = short_req[:2000] + '...'
-                        write_connection_log(f"UPDATE FAILED for user={user_id} - Request: {short_req} - Response: {body}")
+                    write_connection_log(_TMPL_OP_FAILED % ("UPDATE", user_id, req_preview or _preview(data), body))
+                    if LIVE_CAPTURE_ENABLED:
                         append_live_event(f"Update failed for {user_id}")
-                        api_logger.error(f"PUT {update_url} failed: {msg}")
-                    except Exception:
-                        pass
-                    raise Exception(msg)
-                result = resp.json()
-
-                # Record response status and a short preview in logs when enabled
-                if API_LOGGING_ENABLED:
-                    api_logger.info(f"PUT {update_url} - Status: {resp.status_code}")
-                    # Write a compact response summary to the connection log.
-                    try:
-                        preview = json.dumps(result) if isinstance(result, (dict, list)) else str(result)
-                        if len(preview) > 1000:
-                            preview = preview[:1000] + '...'
-                        write_connection_log(f"PUT {update_url} - {resp.status_code} - Response: {preview}")
-                    except Exception:
-                        pass
-                return result
-            except Exception as e:
-                if API_LOGGING_ENABLED:
-                    api_logger.error(f"PUT {update_url} failed: {str(e)}")
-                    try:
-                        write_connection_log(f"PUT {update_url} - ERROR - {str(e)}")
-                    except Exception:
-                        pass
-                raise
+                    api_logger.error(f"PUT {update_url} failed: {msg}")
+                except Exception:
+                    pass
+                raise Exception(msg)
+            result = _json_loads(resp.content)
+
+            # Record response status and a short preview in logs when enabled
+            if API_LOGGING_ENABLED:
+                api_logger.info(f"PUT {update_url} - Status: {resp.status_code}")
+                # Write a compact response summary to the connection log.
+                try:
+                    write_connection_log(_TMPL_RESP % ("PUT", update_url, resp.status_code, _preview(result, 1000)))
+                except Exception:
+                    pass
+            return result
+        except Exception as e:
+            if API_LOGGING_ENABLED:
+                api_logger.error(f"PUT {update_url} failed: {str(e)}")
+                try:
+                    write_connection_log(_TMPL_ERR % ("PUT", update_url, e))
+                except Exception:
+                    pass
+            raise
 
     async def create_user(self, data: dict) -> dict:
         """Create a new user in PingOne.
@@ -313,55 +710,75 @@ class PingOneClient:
         if not token:
             raise Exception("Auth Failed. Check credentials.")
         headers = self._get_auth_headers(token)
-        create_url = f"{self.base_url}/users"
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            try:
-                params = None
+        create_url = self._users_url
+        client = self._get_client()
+        try:
+            params = None
+            if LIVE_CAPTURE_ENABLED:
                 append_live_event(f"POST {create_url}")
-                resp = await client.post(create_url, headers=headers, json=data)
+            resp = await client.post(create_url, headers=headers, content=_json_dumps_bytes(data))
+            try:
+                resp.raise_for_status()
+            except httpx.HTTPStatusError as he:
+                # Include response body for diagnostics
+                body = None
                 try:
-                    resp.raise_for_status()
-                except httpx.HTTPStatusError as he:
-                    # Include response body for diagnostics
-                    body = None
-                    try:
-                        body = he.response.text
-                    except Exception:
-                        body = str(he)
-                    msg = f"{str(he)} - Response: {body}"
-                    # Always write the request payload to the connection log
-                    # on create failures to aid debugging of uniqueness errors.
-                    try:
-                        uname = data.get('username') if isinstance(data, dict) else None
-                        short_req = json.dumps(data) if isinstance(data, (dict, list)) else str(data)
-                        if len(short_req) > 2000:
-                            short_req = short_req[:2000] + '...'
-                        write_connection_log(f"CREATE FAILED for user={uname or '<unknown>'} - Request: {short_req} - Response: {body}")
+                    body = he.response.text
+                except Exception:
+                    body = str(he)
+                msg = f"{str(he)} - Response: {body}"
+                # Always write the request payload to the connection log
+                # on create failures to aid debugging of uniqueness errors.
+                try:
+                    uname = data.get('username') if isinstance(data, dict) else None
+                    write_connection_log(_TMPL_OP_FAILED % ("CREATE", uname or "<unknown>", _preview(data), body))
+                    if LIVE_CAPTURE_ENABLED:
                         append_live_event(f"Create failed for {uname or '<unknown>'}")
-                        api_logger.error(f"Create failed for {uname or '<unknown>'}: {body}")
-                    except Exception:
-                        pass
-                    raise Exception(msg)
-                result = resp.json()
-
-                if API_LOGGING_ENABLED:
-                    api_logger.info(f"POST {create_url} - Status: {resp.status_code}")
-                    try:
-                        preview = json.dumps(result) if isinstance(result, (dict, list)) else str(result)
-                        if len(preview) > 1000:
-                            preview = preview[:1000] + '...'
-                        write_connection_log(f"POST {create_url} - {resp.status_code} - Response: {preview}")
-                    except Exception:
-                        pass
-                return result
-            except Exception as e:
-                if API_LOGGING_ENABLED:
-                    api_logger.error(f"POST {create_url} failed: {str(e)}")
-                    try:
-                        write_connection_log(f"POST {create_url} - ERROR - {str(e)}")
-                    except Exception:
-                        pass
-                raise
+                    api_logger.error(f"Create failed for {uname or '<unknown>'}: {body}")
+                except Exception:
+                    pass
+                raise Exception(msg)
+            result = _json_loads(resp.content)
+
+            if API_LOGGING_ENABLED:
+                api_logger.info(f"POST {create_url} - Status: {resp.status_code}")
+                try:
+                    write_connection_log(_TMPL_RESP % ("POST", create_url, resp.status_code, _preview(result, 1000)))
+                except Exception:
+                    pass
+            return result
+        except Exception as e:
+            if API_LOGGING_ENABLED:
+                api_logger.error(f"POST {create_url} failed: {str(e)}")
+                try:
+                    write_connection_log(_TMPL_ERR % ("POST", create_url, e))
+                except Exception:
+                    pass
+            raise
+
+    async def bulk_create_users(self, rows: list, concurrency: int = 10) -> list:
+        """Create many users concurrently with bounded parallelism.
+
+        Launches `create_user` for each row under an `asyncio.Semaphore`
+        so at most `concurrency` requests are in flight at once over the
+        pooled connection. Returns a list of `(row, result)` tuples where
+        `result` is the created user dict or the Exception raised for
+        that row, so callers can report per-row status.
+        """
+        # Fetch the token once up front so concurrent creates don't all
+        # race into a token refresh at the same time.
+        token = await self.get_token()
+        if not token:
+            raise Exception("Auth Failed. Check credentials.")
+
+        sem = asyncio.Semaphore(max(1, int(concurrency)))
+
+        async def _bounded(row):
+            async with sem:
+                return await self.create_user(row)
+
+        results = await asyncio.gather(*(_bounded(row) for row in rows), return_exceptions=True)
+        return list(zip(rows, results))
 
     async def validate_user(self, data: dict, dry_run: bool = True) -> dict:
         """Validate a user payload. If `dry_run` is True, POST to the
@@ -373,56 +790,45 @@ class PingOneClient:
         if not token:
             raise Exception("Auth Failed. Check credentials.")
         headers = self._get_auth_headers(token)
-        create_url = f"{self.base_url}/users"
+        create_url = self._users_url
         params = {'dryRun': 'true'} if dry_run else None
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        client = self._get_client()
+        if LIVE_CAPTURE_ENABLED:
             append_live_event(f"POST {create_url} (dryRun={dry_run})")
-            resp = await client.post(create_url, headers=headers, json=data, params=params)
+        resp = await client.post(create_url, headers=headers, content=_json_dumps_bytes(data), params=params)
+        try:
+            resp.raise_for_status()
+        except httpx.HTTPStatusError as he:
+            body = None
             try:
-                resp.raise_for_status()
-            except httpx.HTTPStatusError as he:
-                body = None
-                try:
-                    body = he.response.text
-                except Exception:
-                    body = str(he)
-                msg = f"{str(he)} - Response: {body}"
-                # Diagnostic logging to help trace which payload caused a
-                # validation failure. Include username (if present) and a
-                # truncated request body in the connection log and live
-                # capture buffer.
-                try:
-                    uname = data.get('username') if isinstance(data, dict) else None
-                    short_req = json.dumps(data) if isinstance(data, (dict, list)) else str(data)
-                    if len(short_req) > 2000:
-                        short_req = short_req[:2000] + '...'
-                    write_connection_log(f"VALIDATION FAILED for user={uname or '<unknown>'} - Request: {short_req} - Response: {body}")
+                body = he.response.text
+            except Exception:
+                body = str(he)
+            msg = f"{str(he)} - Response: {body}"
+            # Diagnostic logging to help trace which payload caused a
+            # validation failure. Include username (if present) and a
+            # truncated request body in the connection log and live
+            # capture buffer.
+            try:
+                uname = data.get('username') if isinstance(data, dict) else None
+                write_connection_log(_TMPL_OP_FAILED % ("VALIDATION", uname or "<unknown>", _preview(data), body))
+                if LIVE_CAPTURE_ENABLED:
                     append_live_event(f"Validation failed for {uname or '<unknown>'}")
-                    api_logger.error(f"Validation failed for {uname or '<unknown>'}: {body}")
-                except Exception:
-                    pass
-                raise Exception(msg)
-            return resp.json()
+                api_logger.error(f"Validation failed for {uname or '<unknown>'}: {body}")
+            except Exception:
+                pass
+            raise Exception(msg)
+        return _json_loads(resp.content)
 
     def local_validate_user(self, data: dict) -> None:
         """Perform local JSON Schema validation if `jsonschema` and a
         `user_schema.json` file are available. If validation fails an
         Exception is raised. If no schema or library is present this is a no-op.
         """
-        try:
-            import jsonschema
-        except Exception:
-            # jsonschema not installed; skip local validation
-            return
-        schema_file = Path(__file__).resolve().parent.parent / 'user_schema.json'
-        if not schema_file.exists():
+        validator = _get_schema_validator()
+        if validator is None:
             return
-        try:
-            with open(schema_file, 'r', encoding='utf-8') as f:
-                schema = json.load(f)
-            jsonschema.validate(instance=data, schema=schema)
-        except Exception as e:
-            raise
+        validator.validate(data)
 
     async def get_populations(self) -> dict:
         """Return a mapping of population names to IDs for the environment."""
@@ -430,11 +836,40 @@ class PingOneClient:
         if not token:
             raise Exception("Auth Failed. Check credentials.")
         headers = self._get_auth_headers(token)
-        url = f"{self.base_url}/populations"
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        url = self._populations_url
+        client = self._get_client()
+        if LIVE_CAPTURE_ENABLED:
             append_live_event(f"GET {url}")
+        try:
+            import ijson
+        except Exception:
+            # ijson not installed; parse the full response in one go
+            ijson = None
+
+        if ijson is None:
             resp = await client.get(url, headers=headers)
             resp.raise_for_status()
-            data = resp.json()
-            pops = {p['name']: p['id'] for p in data.get('_embedded', {}).get('populations', [])}
-            return pops
+            data = _json_loads(resp.content)
+            return {p['name']: p['id'] for p in data.get('_embedded', {}).get('populations', [])}
+
+        # Stream the response through ijson so only one population item is
+        # materialized at a time; large tenants avoid building the full
+        # object graph (links, counts, etc.) just to keep name and id.
+        pops = {}
+
+        @ijson.coroutine
+        def _collect():
+            while True:
+                item = (yield)
+                pops[item['name']] = item['id']
+
+        parser = ijson.items_coro(_collect(), '_embedded.populations.item')
+        async with client.stream('GET', url, headers=headers) as resp:
+            resp.raise_for_status()
+            async for chunk in resp.aiter_bytes():
+                parser.send(chunk)
+        try:
+            parser.close()
+        except Exception:
+            pass
+        return pops
@@ -4,15 +4,6 @@ Keeping the runner minimal makes it easy to import `run_app()` from tests
 or other scripts without side-effects.
 """
 
-import sys
-from pathlib import Path
-
-# Ensure project root is on sys.path when running app.py directly from the editor
-_THIS_FILE = Path(__file__).resolve()
-_PROJECT_ROOT = _THIS_FILE.parent
-if str(_PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(_PROJECT_ROOT))
-
 from PySide6 import QtWidgets
 from ui.main_window import MainWindow
 import api.client as api_client
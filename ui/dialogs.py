@@ -4,10 +4,13 @@ Contains small, focused dialogs for editing user fields, selecting
 table columns, and viewing/editing JSON payloads.
 """
 
+import bisect
+import functools
 import json
 import sys
 import platform
 from pathlib import Path
+from typing import NamedTuple
 
 # Add project root to sys.path when running this file directly so
 # `from ui.dialogs` and other absolute imports resolve in editor-run mode.
@@ -16,34 +19,135 @@ _PROJECT_ROOT = _THIS_FILE.parent.parent
 if str(_PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(_PROJECT_ROOT))
 
+# README link used by help text in error dialogs; _PROJECT_ROOT is
+# already resolved, so this costs no extra stat calls at import.
+_README_URL = (_PROJECT_ROOT / 'README.md').as_uri()
+
 from PySide6 import QtWidgets, QtCore, QtGui
 
+# Optional fast JSON codec for the view/save dialogs; these calls run on
+# the Qt event loop, so faster encode/decode directly shortens
+# dialog-open latency on large user records.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps_pretty(obj) -> str:
+    """Pretty-print a payload for display, preferring orjson."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode()
+    return json.dumps(obj, indent=2)
+
+
+def _loads(text):
+    """Parse JSON text; raises ValueError (JSONDecodeError) on bad input."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+# Common file-header -> API attribute mappings used when suggesting a
+# mapping for imported files. Hoisted to module scope so suggesting a
+# mapping is a single dict lookup instead of rebuilding this table for
+# every header.
+_COMMON_ATTR_MAP = {
+    'first name': 'name.given', 'first_name': 'name.given', 'firstname': 'name.given', 'given': 'name.given', 'first': 'name.given',
+    'last name': 'name.family', 'last_name': 'name.family', 'lastname': 'name.family', 'family': 'name.family', 'last': 'name.family', 'surname': 'name.family',
+    'email': 'email', 'e-mail': 'email',
+    'username': 'username', 'user name': 'username', 'user': 'username',
+    'phone': 'phoneNumbers', 'phone number': 'phoneNumbers', 'phone_number': 'phoneNumbers', 'phonenumber': 'phoneNumbers',
+    'population': 'population.id', 'population.name': 'population.id',
+    'id': 'id', 'uuid': 'id',
+    'street': 'address.street', 'address.street': 'address.street',
+    'city': 'address.city', 'state': 'address.region', 'zip': 'address.postalCode', 'postalcode': 'address.postalCode', 'country': 'address.country'
+}
+
+# Header-normalization helpers for _suggest_attr: one translate() pass
+# replaces the chained .replace() calls, and frozenset membership beats
+# tuple scans for the name heuristics.
+_SEP_TRANS = str.maketrans({' ': '.', '_': '.'})
+_GIVEN_KEYS = frozenset({'first', 'given'})
+_FAMILY_KEYS = frozenset({'last', 'family', 'surname'})
+
+
 # Platform detection for cross-platform UI optimization
 IS_MACOS = platform.system() == 'Darwin'
 IS_WINDOWS = platform.system() == 'Windows'
 IS_LINUX = platform.system() == 'Linux'
 
 
+# Memoized DPI scale; every dialog open used to re-query the primary
+# screen for each scale_size call. Invalidated when the screen topology
+# or DPI changes, so stale values never stick after a monitor swap.
+_dpi_cache = None
+_dpi_watch_connected = False
+
+
+def _invalidate_dpi_cache(*_args):
+    global _dpi_cache
+    _dpi_cache = None
+
+
 def get_dpi_scale():
     """Get the current DPI scale factor for sizing dialogs appropriately."""
+    global _dpi_cache, _dpi_watch_connected
+    if _dpi_cache is not None:
+        return _dpi_cache
     try:
-        screen = QtWidgets.QApplication.primaryScreen()
+        app = QtWidgets.QApplication.instance()
+        screen = app.primaryScreen() if app else None
         if screen:
-            return screen.devicePixelRatio()
+            _dpi_cache = screen.devicePixelRatio()
+            if not _dpi_watch_connected:
+                try:
+                    app.screenAdded.connect(_invalidate_dpi_cache)
+                    app.screenRemoved.connect(_invalidate_dpi_cache)
+                    app.primaryScreenChanged.connect(_invalidate_dpi_cache)
+                    _dpi_watch_connected = True
+                except Exception:
+                    pass
+            try:
+                screen.logicalDotsPerInchChanged.connect(
+                    _invalidate_dpi_cache, QtCore.Qt.UniqueConnection)
+            except Exception:
+                pass
+            return _dpi_cache
     except Exception:
         pass
     return 1.0
 
 
+@functools.lru_cache(maxsize=32)
+def _scaled(base_size, dpi_scale):
+    return int(base_size * max(1.0, dpi_scale * 0.8))
+
+
 def scale_size(base_size, dpi_scale=None):
-    """Scale a size value based on DPI, ensuring minimum readability."""
+    """Scale a size value based on DPI, ensuring minimum readability.
+
+    Base sizes are compile-time constants and the DPI rarely changes, so
+    the arithmetic is cached per (size, dpi) pair.
+    """
     if dpi_scale is None:
         dpi_scale = get_dpi_scale()
-    return int(base_size * max(1.0, dpi_scale * 0.8))
+    return _scaled(base_size, dpi_scale)
 
 
 class EditUserDialog(QtWidgets.QDialog):
     """Dialog for editing user information."""
+
+    # (widget attribute, API key) pairs for the optional address block;
+    # get_data walks this so each widget's text is read exactly once.
+    _ADDR_FIELDS = (
+        ('street', 'streetAddress'),
+        ('city', 'locality'),
+        ('state', 'region'),
+        ('zip', 'postalCode'),
+        ('country', 'country'),
+    )
+
     def __init__(self, user_data, pop_map, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Edit User")
@@ -52,77 +156,111 @@ class EditUserDialog(QtWidgets.QDialog):
         # Set minimum size based on DPI
         dpi_scale = get_dpi_scale()
         self.setMinimumSize(scale_size(450, dpi_scale), scale_size(400, dpi_scale))
-        
-        layout = QtWidgets.QFormLayout(self)
-        
-        self.username = QtWidgets.QLineEdit(user_data.get('username', ''))
-        self.email = QtWidgets.QLineEdit(user_data.get('email', ''))
-        self.first_name = QtWidgets.QLineEdit(user_data.get('name', {}).get('given', ''))
-        self.last_name = QtWidgets.QLineEdit(user_data.get('name', {}).get('family', ''))
-        self.phone = QtWidgets.QLineEdit()
+
+        # Build the form detached and attach it once at the end; each
+        # addRow on a parented layout schedules an invalidate/relayout,
+        # so this keeps dialog construction at one layout pass.
+        self.setUpdatesEnabled(False)
+        layout = QtWidgets.QFormLayout()
+
+        name = user_data.get('name', {})
+        address = user_data.get('address', {})
+
+        # Create line edits empty and only setText for non-blank values;
+        # passing '' through the constructor still builds a QString per
+        # call. The field list is data-driven so creation, attribute
+        # binding, and the form row happen in one pass per field.
         phones = user_data.get('phoneNumbers', [])
-        if phones:
-            self.phone.setText(phones[0].get('number', ''))
-        self.street = QtWidgets.QLineEdit(user_data.get('address', {}).get('streetAddress', ''))
-        self.city = QtWidgets.QLineEdit(user_data.get('address', {}).get('locality', ''))
-        self.state = QtWidgets.QLineEdit(user_data.get('address', {}).get('region', ''))
-        self.zip = QtWidgets.QLineEdit(user_data.get('address', {}).get('postalCode', ''))
-        self.country = QtWidgets.QLineEdit(user_data.get('address', {}).get('country', ''))
+        phone = phones[0].get('number', '') if phones else ''
+        for attr, label, value in (
+            ('username', "Username:", user_data.get('username', '')),
+            ('email', "Email:", user_data.get('email', '')),
+            ('first_name', "First Name:", name.get('given', '')),
+            ('last_name', "Last Name:", name.get('family', '')),
+            ('phone', "Phone:", phone),
+        ):
+            field = QtWidgets.QLineEdit()
+            if value:
+                field.setText(value)
+            setattr(self, attr, field)
+            layout.addRow(label, field)
+
+        # Address sub-fields live in a collapsible group that starts
+        # collapsed when the user has no address; Qt skips layout and
+        # paint for the hidden children until the group is expanded.
+        self.address_group = QtWidgets.QGroupBox("Address")
+        self.address_group.setCheckable(True)
+        self.address_group.setChecked(bool(address))
+        addr_form = QtWidgets.QFormLayout(self.address_group)
+        self.street = QtWidgets.QLineEdit()
+        self.city = QtWidgets.QLineEdit()
+        self.state = QtWidgets.QLineEdit()
+        self.zip = QtWidgets.QLineEdit()
+        self.country = QtWidgets.QLineEdit()
+        for widget, value in (
+            (self.street, address.get('streetAddress', '')),
+            (self.city, address.get('locality', '')),
+            (self.state, address.get('region', '')),
+            (self.zip, address.get('postalCode', '')),
+            (self.country, address.get('country', '')),
+        ):
+            if value:
+                widget.setText(value)
+        addr_form.addRow("Street Address:", self.street)
+        addr_form.addRow("City:", self.city)
+        addr_form.addRow("State/Region:", self.state)
+        addr_form.addRow("ZIP/Postal Code:", self.zip)
+        addr_form.addRow("Country:", self.country)
+
+        # Carry the population id as itemData so accept reads it straight
+        # off the combo; no name->id reconstruction, and duplicate
+        # population names can't resolve to the wrong id.
         self.population = QtWidgets.QComboBox()
-        self.population.addItems(list(pop_map.values()))
+        for pid, pop_name in pop_map.items():
+            self.population.addItem(pop_name, pid)
         current_pop_id = user_data.get('population', {}).get('id', '')
-        current_pop_name = pop_map.get(current_pop_id, '')
-        self.population.setCurrentText(current_pop_name)
+        idx = self.population.findData(current_pop_id)
+        if idx >= 0:
+            self.population.setCurrentIndex(idx)
         self.population.setEnabled(False)  # Population not modifiable
         
-        layout.addRow("Username:", self.username)
-        layout.addRow("Email:", self.email)
-        layout.addRow("First Name:", self.first_name)
-        layout.addRow("Last Name:", self.last_name)
-        layout.addRow("Phone:", self.phone)
-        layout.addRow("Street Address:", self.street)
-        layout.addRow("City:", self.city)
-        layout.addRow("State/Region:", self.state)
-        layout.addRow("ZIP/Postal Code:", self.zip)
-        layout.addRow("Country:", self.country)
+        layout.addRow(self.address_group)
         layout.addRow("Population:", self.population)
         
         buttons = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.Ok | QtWidgets.QDialogButtonBox.Cancel)
         buttons.accepted.connect(self.accept)
         buttons.rejected.connect(self.reject)
         layout.addRow(buttons)
-        
+
+        self.setLayout(layout)
+        self.setUpdatesEnabled(True)
+
         self.user_data = user_data
         self.pop_map = pop_map
-    
+
     def get_data(self):
         """Return the updated user data from the dialog."""
         # Build a minimal user update payload containing only fields that
         # the UI allows editing. This keeps updates concise and reduces
         # risk of accidentally overwriting unrelated attributes.
-        pop_name = self.population.currentText()
-        pop_id = next((k for k, v in self.pop_map.items() if v == pop_name), '')
+        pop_id = self.population.currentData() or ''
         data = {
             "username": self.username.text(),
             "email": self.email.text(),
             "name": {"given": self.first_name.text(), "family": self.last_name.text()},
             "population": {"id": pop_id}
         }
-        if self.phone.text():
-            data["phoneNumbers"] = [{"number": self.phone.text(), "type": "mobile"}]
-        address = {}
-        if self.street.text():
-            address["streetAddress"] = self.street.text()
-        if self.city.text():
-            address["locality"] = self.city.text()
-        if self.state.text():
-            address["region"] = self.state.text()
-        if self.zip.text():
-            address["postalCode"] = self.zip.text()
-        if self.country.text():
-            address["country"] = self.country.text()
-        if address:
-            data["address"] = address
+        # Read each widget once: every .text() call crosses the
+        # Python/Qt binding boundary.
+        phone = self.phone.text()
+        if phone:
+            data["phoneNumbers"] = [{"number": phone, "type": "mobile"}]
+        if self.address_group.isChecked():
+            address = {api_key: val
+                       for attr, api_key in self._ADDR_FIELDS
+                       if (val := getattr(self, attr).text())}
+            if address:
+                data["address"] = address
         return data
 
 
@@ -146,19 +284,27 @@ class ColumnSelectDialog(QtWidgets.QDialog):
         sorted_cols = sorted(all_columns)
         mid = len(sorted_cols) // 2
         
-        for col_list in [sorted_cols[:mid], sorted_cols[mid:]]:
-            col_layout = QtWidgets.QVBoxLayout()
-            for col in col_list:
-                cb = QtWidgets.QCheckBox(col)
-                cb.setChecked(col in selected)
-                if col == 'id':
-                    cb.setEnabled(False)
-                col_layout.addWidget(cb)
-                self.checkboxes[col] = cb
-            col_layout.addStretch()
-            columns_layout.addLayout(col_layout)
-        
-        main_layout.addLayout(columns_layout)
+        # Batch the checkbox construction: defer paint/layout until the
+        # full set is built so large column lists get one layout pass.
+        self.setUpdatesEnabled(False)
+        try:
+            for col_list in [sorted_cols[:mid], sorted_cols[mid:]]:
+                col_layout = QtWidgets.QVBoxLayout()
+                for col in col_list:
+                    cb = QtWidgets.QCheckBox(col)
+                    cb.blockSignals(True)
+                    cb.setChecked(col in selected)
+                    cb.blockSignals(False)
+                    if col == 'id':
+                        cb.setEnabled(False)
+                    col_layout.addWidget(cb)
+                    self.checkboxes[col] = cb
+                col_layout.addStretch()
+                columns_layout.addLayout(col_layout)
+
+            main_layout.addLayout(columns_layout)
+        finally:
+            self.setUpdatesEnabled(True)
         
         # Buttons
         buttons_layout = QtWidgets.QHBoxLayout()
@@ -189,11 +335,14 @@ class ColumnSelectDialog(QtWidgets.QDialog):
         # If defaults were applied, return them in the correct order
         if self.defaults_applied and self.parent_window and hasattr(self.parent_window, 'default_columns'):
             default_columns = self.parent_window.default_columns
+            # Frozen membership set so the per-checkbox loop below is O(1)
+            # per column rather than a scan over the defaults list.
+            default_set = frozenset(default_columns)
             # Return defaults first, then any additional selected columns
             selected = [col for col in default_columns if self.checkboxes.get(col, QtWidgets.QCheckBox()).isChecked()]
             # Add any non-default columns that are selected
             for col, cb in self.checkboxes.items():
-                if cb.isChecked() and col not in default_columns:
+                if cb.isChecked() and col not in default_set:
                     selected.append(col)
             return selected
         
@@ -209,25 +358,91 @@ class ColumnSelectDialog(QtWidgets.QDialog):
         # Mark that defaults were applied
         self.defaults_applied = True
         
-        # Update checkboxes
-        for col, cb in self.checkboxes.items():
-            if col == 'id':
-                continue  # Always checked and disabled
-            cb.setChecked(col in default_columns)
+        # Update checkboxes in one batch without per-widget signal traffic
+        default_set = frozenset(default_columns)
+        self.setUpdatesEnabled(False)
+        try:
+            for col, cb in self.checkboxes.items():
+                if col == 'id':
+                    continue  # Always checked and disabled
+                cb.blockSignals(True)
+                cb.setChecked(col in default_set)
+                cb.blockSignals(False)
+        finally:
+            self.setUpdatesEnabled(True)
     
     def select_all(self):
         """Select all column checkboxes."""
         self.defaults_applied = False  # Clear defaults flag since this is a custom selection
-        for col, cb in self.checkboxes.items():
-            cb.setChecked(True)
+        self.setUpdatesEnabled(False)
+        try:
+            for cb in self.checkboxes.values():
+                cb.blockSignals(True)
+                cb.setChecked(True)
+                cb.blockSignals(False)
+        finally:
+            self.setUpdatesEnabled(True)
     
     def clear_all(self):
         """Clear all column checkboxes except the required 'id' column."""
         self.defaults_applied = False  # Clear defaults flag since this is a custom selection
-        for col, cb in self.checkboxes.items():
-            if col == 'id':
-                continue  # ID is always required and disabled
-            cb.setChecked(False)
+        self.setUpdatesEnabled(False)
+        try:
+            for col, cb in self.checkboxes.items():
+                if col == 'id':
+                    continue  # ID is always required and disabled
+                cb.blockSignals(True)
+                cb.setChecked(False)
+                cb.blockSignals(False)
+        finally:
+            self.setUpdatesEnabled(True)
+
+
+class _SerializeSignals(QtCore.QObject):
+    """Signal carrier for pool-thread serialization (QRunnable is not a QObject)."""
+    done = QtCore.Signal(str)
+
+
+class _SerializeTask(QtCore.QRunnable):
+    """Pretty-print a payload off the UI thread and emit the result."""
+
+    def __init__(self, data, signals: _SerializeSignals):
+        super().__init__()
+        self._data = data
+        self._signals = signals
+
+    def run(self):
+        try:
+            text = _dumps_pretty(self._data)
+        except (TypeError, ValueError):
+            text = str(self._data)
+        self._signals.done.emit(text)
+
+
+class _SaveSignals(QtCore.QObject):
+    """Signal carrier for pool-thread work; emits the result or Exception."""
+    done = QtCore.Signal(object)
+
+
+class _SaveTask(QtCore.QRunnable):
+    """Run a callable off the UI thread and emit its return value.
+
+    A raised exception is emitted in place of the result so the GUI-side
+    slot can distinguish the two.
+    """
+
+    def __init__(self, fn, signals: _SaveSignals):
+        super().__init__()
+        self._fn = fn
+        self._signals = signals
+
+    def run(self):
+        try:
+            result = self._fn()
+        except Exception as e:
+            self._signals.done.emit(e)
+        else:
+            self._signals.done.emit(result)
 
 
 class JSONViewDialog(QtWidgets.QDialog):
@@ -245,7 +460,12 @@ class JSONViewDialog(QtWidgets.QDialog):
         
         layout = QtWidgets.QVBoxLayout(self)
         self.text = QtWidgets.QTextEdit()
-        self.text.setPlainText(json.dumps(data, indent=2))
+        # Defer serialization until the dialog is first shown: construction
+        # stays cheap and the window frame paints before a large payload is
+        # rendered into the text widget.
+        self._raw = data
+        self._populated = False
+        self._pending_text = None
         if not editable:
             self.text.setReadOnly(True)
         layout.addWidget(self.text)
@@ -258,7 +478,59 @@ class JSONViewDialog(QtWidgets.QDialog):
         close_btn.clicked.connect(self.accept)
         buttons.addWidget(close_btn)
         layout.addLayout(buttons)
-    
+        # Long sessions open many of these; drop the large document and
+        # payload references once the dialog is done so nothing pins the
+        # parent window or a big QTextDocument in memory.
+        self.finished.connect(self._release)
+
+    def _release(self, _result=0):
+        self.text.clear()
+        self._raw = None
+        self._pending_text = None
+        self.parent = None
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._populated:
+            self._populated = True
+            # Fill after the first paint so the dialog appears immediately
+            QtCore.QTimer.singleShot(0, self._populate)
+
+    def _populate(self):
+        # Big payloads get serialized on a pool thread so the event loop
+        # keeps painting; the rough repr-length check avoids paying for
+        # a thread handoff on small records.
+        if len(repr(self._raw)) > 64000:
+            self._ser_signals = _SerializeSignals()
+            self._ser_signals.done.connect(self._set_text)
+            QtCore.QThreadPool.globalInstance().start(
+                _SerializeTask(self._raw, self._ser_signals))
+            return
+        self._set_text(_dumps_pretty(self._raw))
+
+    def _set_text(self, text: str):
+        if len(text) <= 65536:
+            self.text.setPlainText(text)
+            return
+        # Large payloads are fed in 32KB slices with repaints suspended,
+        # yielding to the event loop between chunks so the dialog stays
+        # responsive instead of freezing on one huge setPlainText.
+        self.text.setUpdatesEnabled(False)
+        self.text.clear()
+        self._pending_text = text
+        self._pending_pos = 0
+        self._feed_chunk()
+
+    def _feed_chunk(self):
+        chunk = self._pending_text[self._pending_pos:self._pending_pos + 32768]
+        self._pending_pos += 32768
+        self.text.insertPlainText(chunk)
+        if self._pending_pos < len(self._pending_text):
+            QtCore.QTimer.singleShot(0, self._feed_chunk)
+        else:
+            self._pending_text = None
+            self.text.setUpdatesEnabled(True)
+
     def save_changes(self):
         """Save the edited JSON back to the user data."""
         # Validate selection before attempting to save edits back to the
@@ -267,10 +539,11 @@ class JSONViewDialog(QtWidgets.QDialog):
             QtWidgets.QMessageBox.warning(self, "Error", "No user selected for saving.")
             return
         try:
-            new_data = json.loads(self.text.toPlainText())
+            new_data = _loads(self.text.toPlainText())
             self.parent.update_user_field(self.user_id, self.col_name, new_data)
             QtWidgets.QMessageBox.information(self, "Saved", "JSON updated successfully.")
-        except json.JSONDecodeError:
+        except ValueError:
+            # Both json.JSONDecodeError and orjson.JSONDecodeError subclass ValueError
             QtWidgets.QMessageBox.warning(self, "Error", "Invalid JSON format.")
 
 
@@ -292,13 +565,19 @@ class TextViewDialog(QtWidgets.QDialog):
         layout = QtWidgets.QVBoxLayout(self)
         self.text = QtWidgets.QTextEdit()
         self.text.setReadOnly(not bool(editable))
-        self.text.setPlainText(text or '')
+        # Small content is set directly; large blobs are deferred to the
+        # first show so opening the dialog is not blocked by text layout.
+        self._raw_text = text or ''
+        self._populated = len(self._raw_text) <= 65536
+        if self._populated:
+            self.text.setPlainText(self._raw_text)
         layout.addWidget(self.text)
         btns = QtWidgets.QDialogButtonBox()
+        self._save_btn = None
         if editable:
-            save_btn = QtWidgets.QPushButton("Save")
-            save_btn.clicked.connect(self._on_save)
-            btns.addButton(save_btn, QtWidgets.QDialogButtonBox.ActionRole)
+            self._save_btn = QtWidgets.QPushButton("Save")
+            self._save_btn.clicked.connect(self._on_save)
+            btns.addButton(self._save_btn, QtWidgets.QDialogButtonBox.ActionRole)
         close_btn = QtWidgets.QPushButton("Close")
         close_btn.clicked.connect(self.accept)
         btns.addButton(close_btn, QtWidgets.QDialogButtonBox.RejectRole)
@@ -307,6 +586,20 @@ class TextViewDialog(QtWidgets.QDialog):
         self._user_id = user_id
         self._col_name = col_name
         self._parent = parent
+        # Free the document and parent reference when the dialog is done;
+        # blob content can be large and these dialogs are opened often.
+        self.finished.connect(self._release)
+
+    def _release(self, _result=0):
+        self.text.clear()
+        self._raw_text = ''
+        self._parent = None
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._populated:
+            self._populated = True
+            QtCore.QTimer.singleShot(0, lambda: self.text.setPlainText(self._raw_text))
 
     def _on_save(self):
         """Save edited text back to the user field via parent.update_user_field."""
@@ -314,26 +607,76 @@ class TextViewDialog(QtWidgets.QDialog):
             return
         new_text = self.text.toPlainText()
         # If parent exposes update_user_field, call it
-        try:
-            if self._parent and hasattr(self._parent, 'update_user_field') and self._user_id and self._col_name:
+        if self._parent and hasattr(self._parent, 'update_user_field') and self._user_id and self._col_name:
+
+            def _parse():
                 # Attempt to preserve JSON if the content looks like JSON
-                import json as _json
-                out = new_text
                 try:
-                    parsed = _json.loads(new_text)
-                    out = parsed
-                except Exception:
-                    out = new_text
-                self._parent.update_user_field(self._user_id, self._col_name, out)
-                QtWidgets.QMessageBox.information(self, "Saved", "Changes saved.")
-                self.accept()
-                return
-        except Exception as e:
-            QtWidgets.QMessageBox.critical(self, "Save Failed", str(e))
+                    return _loads(new_text)
+                except (ValueError, TypeError):
+                    return new_text
+
+            # Only the parse is slow for large content, so run just that
+            # on the pool; update_user_field touches widgets and spawns
+            # workers and must stay on the GUI thread, which the queued
+            # done signal guarantees.
+            self._save_btn.setEnabled(False)
+            self._save_signals = _SaveSignals()
+            self._save_signals.done.connect(self._on_parse_done)
+            QtCore.QThreadPool.globalInstance().start(
+                _SaveTask(_parse, self._save_signals))
             return
         # Fallback: just close
         self.accept()
 
+    def _on_parse_done(self, result):
+        if self._save_btn is not None:
+            self._save_btn.setEnabled(True)
+        if isinstance(result, Exception):
+            QtWidgets.QMessageBox.critical(self, "Save Failed", str(result))
+            return
+        self._parent.update_user_field(self._user_id, self._col_name, result)
+        QtWidgets.QMessageBox.information(self, "Saved", "Changes saved.")
+        self.accept()
+
+
+# Item role carrying the population-kind string ('id'|'name') for the
+# Type column; the delegate below paints from it directly.
+_KIND_ROLE = QtCore.Qt.UserRole + 1
+
+# Exact mapped-value -> kind classification for the Type column.
+_KIND_FOR_MAPPED = {'population.id': 'id', 'population.name': 'name'}
+
+
+class _KindDelegate(QtWidgets.QStyledItemDelegate):
+    """Paints the population-kind disc straight into the cell.
+
+    Drawing in the delegate keeps the Type column at one string of row
+    state and two shared QColor objects — no per-row pixmap or icon
+    allocation at all.
+    """
+
+    _COLORS = {
+        'id': QtGui.QColor('#d9534f'),
+        'name': QtGui.QColor('#007bff'),
+    }
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        color = self._COLORS.get(index.data(_KIND_ROLE))
+        if color is not None:
+            painter.save()
+            try:
+                painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+                painter.setBrush(color)
+                painter.setPen(QtCore.Qt.NoPen)
+                rect = option.rect
+                d = 12
+                painter.drawEllipse(
+                    rect.x() + 4, rect.y() + (rect.height() - d) // 2, d, d)
+            finally:
+                painter.restore()
+
 
 class AttributeMappingDialog(QtWidgets.QDialog):
     """Dialog to review and edit mapping from file headers to API attribute names.
@@ -344,8 +687,32 @@ class AttributeMappingDialog(QtWidgets.QDialog):
     suggested mapping). Returns a tuple `(mapping_dict, fixed_population_id)` where
     `fixed_population_id` is a population id chosen from the dropdown or `None`.
     """
+
+    @staticmethod
+    def _suggest_attr(hdr: str) -> str:
+        """Suggest an API attribute name for a file header."""
+        if not hdr:
+            return hdr
+        low = hdr.strip().lower()
+        # Common explicit mappings
+        common = _COMMON_ATTR_MAP.get(low)
+        if common is not None:
+            return common
+        # Try dot-notation heuristics
+        key = low.translate(_SEP_TRANS)
+        if key in _GIVEN_KEYS:
+            return 'name.given'
+        if key in _FAMILY_KEYS:
+            return 'name.family'
+        if key.startswith('name.'):
+            return key
+        return key
+
     def __init__(self, headers, parent=None, pop_map: dict = None, initial_mapping: dict = None, initial_fixed_pop_id: str = None, initial_fixed_enabled=None):
         super().__init__(parent)
+        # Set up-front so get_mapping can test the attribute directly even
+        # if construction bails before the checkbox is created.
+        self.remember_cb = None
         self.setWindowTitle("Attribute Mapping")
         self.setModal(True)
         
@@ -357,6 +724,10 @@ class AttributeMappingDialog(QtWidgets.QDialog):
 
         # Keep a local copy of headers for dropdowns
         self.headers = list(headers or [])
+        # Case-insensitive header -> combo index lookup, built once. The
+        # +1 accounts for the leading '<None>' item in each combo; this
+        # replaces per-combo linear scans over the header list.
+        self._hdr_index = {h.lower(): i + 1 for i, h in enumerate(self.headers)}
         # population map: name -> id
         self.pop_map = pop_map or {}
         # persist initial fixed population id for use during mapping retrieval
@@ -377,15 +748,12 @@ class AttributeMappingDialog(QtWidgets.QDialog):
 
         # Helper to populate header-selection combos (allow empty selection)
         def _populate_hdr_combo(cb: QtWidgets.QComboBox, default_suggest: str = None):
-            cb.addItem("<None>")
-            for h in self.headers:
-                cb.addItem(h)
+            cb.addItems(["<None>", *self.headers])
             # Try to auto-select a suggested header if present
             if default_suggest:
-                for i in range(cb.count()):
-                    if cb.itemText(i).lower() == default_suggest.lower():
-                        cb.setCurrentIndex(i)
-                        break
+                idx = self._hdr_index.get(default_suggest.lower())
+                if idx is not None:
+                    cb.setCurrentIndex(idx)
 
         _populate_hdr_combo(self.username_field, 'username')
         _populate_hdr_combo(self.email_field, 'email')
@@ -412,27 +780,33 @@ class AttributeMappingDialog(QtWidgets.QDialog):
         # If an initial mapping was provided, pre-select choices where possible
         try:
             if initial_mapping and isinstance(initial_mapping, dict):
-                def _select_header_for(target_attr, combo):
-                    for hdr, mapped in initial_mapping.items():
-                        if mapped == target_attr:
-                            idx = combo.findText(hdr)
-                            if idx != -1:
-                                combo.setCurrentIndex(idx)
-                                return
-                _select_header_for('username', self.username_field)
-                _select_header_for('email', self.email_field)
-                _select_header_for('name.given', self.given_field)
-                _select_header_for('name.family', self.family_field)
-                # population may have been stored as population.id mapping
-                _select_header_for('population.id', self.population_field)
-                # initial_fixed_enabled handled above; ignore header-mapped enabled values
+                # Invert once so each field is a dict lookup instead of a
+                # scan over the mapping plus a findText per combo.
+                attr_to_hdr = {mapped: hdr for hdr, mapped in initial_mapping.items()}
+                # population may have been stored as population.id mapping;
+                # initial_fixed_enabled handled above; ignore header-mapped
+                # enabled values
+                for target_attr, combo in (
+                    ('username', self.username_field),
+                    ('email', self.email_field),
+                    ('name.given', self.given_field),
+                    ('name.family', self.family_field),
+                    ('population.id', self.population_field),
+                ):
+                    hdr = attr_to_hdr.get(target_attr)
+                    if hdr is None:
+                        continue
+                    idx = self._hdr_index.get(hdr.lower())
+                    if idx is not None:
+                        combo.setCurrentIndex(idx)
         except Exception:
             pass
 
-        # Populate population_fixed dropdown with a default <Use CSV Field> option
+        # The fixed-population dropdown only needs its placeholder before
+        # first paint; sorting and loading a large population list is
+        # deferred to showEvent so the dialog appears immediately.
         self.population_fixed.addItem("<Use CSV Field>")
-        for name, pid in sorted(self.pop_map.items(), key=lambda x: x[0].lower()):
-            self.population_fixed.addItem(f"{name} ({pid})", pid)
+        self._pops_loaded = False
 
         form.addRow("Username field:", self.username_field)
         form.addRow("Email field:", self.email_field)
@@ -454,64 +828,22 @@ class AttributeMappingDialog(QtWidgets.QDialog):
         # Add a third column which shows the mapping "type" (id/name) compactly
         self.table = QtWidgets.QTableWidget(len(self.headers), 3)
         self.table.setHorizontalHeaderLabels(["File Header", "Mapped Attribute", "Type"])
-        self.table.horizontalHeader().setStretchLastSection(True)
-
-        def _suggest_attr(hdr: str) -> str:
-            if not hdr:
-                return hdr
-            s = hdr.strip()
-            low = s.lower()
-            # Common explicit mappings
-            commons = {
-                'first name': 'name.given', 'first_name': 'name.given', 'firstname': 'name.given', 'given': 'name.given',
-                'last name': 'name.family', 'last_name': 'name.family', 'lastname': 'name.family', 'family': 'name.family',
-                'email': 'email', 'e-mail': 'email',
-                'username': 'username', 'user name': 'username', 'user': 'username',
-                'phone': 'phoneNumbers', 'phone number': 'phoneNumbers', 'phone_number': 'phoneNumbers', 'phonenumber': 'phoneNumbers',
-                'population': 'population.id', 'population.name': 'population.id',
-                'id': 'id', 'uuid': 'id',
-                'street': 'address.street', 'address.street': 'address.street',
-                'city': 'address.city', 'state': 'address.region', 'zip': 'address.postalCode', 'postalcode': 'address.postalCode', 'country': 'address.country'
-            }
-            if low in commons:
-                return commons[low]
-            # Try dot-notation heuristics
-            key = low.replace(' ', '.').replace('_', '.')
-            if key in ('first', 'given'):
-                return 'name.given'
-            if key in ('last', 'family', 'surname'):
-                return 'name.family'
-            if key.startswith('name.'):
-                return key
-            return key
-
-        def _make_type_icon(kind: str) -> QtGui.QPixmap:
-            """Return a small circular pixmap for the given kind ('id'|'name')."""
-            pix = QtGui.QPixmap(14, 14)
-            pix.fill(QtCore.Qt.transparent)
-            painter = QtGui.QPainter(pix)
-            try:
-                painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
-                if kind == 'id':
-                    color = QtGui.QColor('#d9534f')
-                elif kind == 'name':
-                    color = QtGui.QColor('#007bff')
-                else:
-                    color = QtGui.QColor('#cccccc')
-                brush = QtGui.QBrush(color)
-                painter.setBrush(brush)
-                pen = QtGui.QPen(QtCore.Qt.transparent)
-                painter.setPen(pen)
-                painter.drawEllipse(1, 1, 12, 12)
-            finally:
-                painter.end()
-            return pix
+        # Bind the header view once; each horizontalHeader() call is a
+        # binding crossing and it is needed several times below.
+        header = self.table.horizontalHeader()
+        header.setStretchLastSection(True)
+        self.table.setItemDelegateForColumn(2, _KindDelegate(self.table))
 
-        for r, h in enumerate(self.headers):
-            item_h = QtWidgets.QTableWidgetItem(h)
-            item_h.setFlags(item_h.flags() & ~QtCore.Qt.ItemIsEditable)
-            self.table.setItem(r, 0, item_h)
-            suggested = _suggest_attr(h)
+        # Batch the build: suppress repaints, signals, and sorting while
+        # rows are inserted so Qt lays the table out once at the end
+        # instead of per setItem call. itemChanged is connected only
+        # after population, so no suppression flag is needed here.
+        # Mirror of the (header, mapped) column pair kept in plain Python;
+        # get_mapping reads this instead of crossing into Qt twice per row.
+        # Prefilled here in full (pure Python, no Qt items) so widget
+        # construction can be gated to the rows actually scrolled into view.
+        self._row_cache = []
+        for h in self.headers:
             # If an explicit initial mapping exists for this header use it
             mapped_val = None
             try:
@@ -519,38 +851,17 @@ class AttributeMappingDialog(QtWidgets.QDialog):
                     mapped_val = initial_mapping.get(h)
             except Exception:
                 mapped_val = None
-            item_m = QtWidgets.QTableWidgetItem(mapped_val if mapped_val is not None else suggested)
-            # If this header is mapped to the system `id`, mark it read-only and clarify tooltip
-            try:
-                mapped_target = mapped_val if mapped_val is not None else suggested
-                if mapped_target == 'id':
-                    item_m.setFlags(item_m.flags() & ~QtCore.Qt.ItemIsEditable)
-                    item_m.setToolTip('System-generated ID (read-only) — values will be ignored on import')
-                    type_item = QtWidgets.QTableWidgetItem()
-                    type_item.setFlags(type_item.flags() & ~QtCore.Qt.ItemIsEditable)
-                    type_item.setIcon(QtGui.QIcon(_make_type_icon('id')))
-                    type_item.setToolTip('population.id (read-only)')
-                    self.table.setItem(r, 2, type_item)
-                else:
-                    item_m.setToolTip('Suggested mapping; edit if needed')
-                    # If the suggested mapping is population.name or population.id, show icon type
-                    if mapped_target.startswith('population'):
-                        kind = 'id' if mapped_target.endswith('.id') else 'name'
-                        type_item = QtWidgets.QTableWidgetItem()
-                        type_item.setFlags(type_item.flags() & ~QtCore.Qt.ItemIsEditable)
-                        type_item.setIcon(QtGui.QIcon(_make_type_icon(kind)))
-                        type_item.setToolTip(f'population.{kind}')
-                        self.table.setItem(r, 2, type_item)
-            except Exception:
-                item_m.setToolTip('Suggested mapping; edit if needed')
-            self.table.setItem(r, 1, item_m)
-            # ensure Type column has an item for rows without population mapping
-            if not self.table.item(r, 2):
-                empty = QtWidgets.QTableWidgetItem('')
-                empty.setFlags(empty.flags() & ~QtCore.Qt.ItemIsEditable)
-                self.table.setItem(r, 2, empty)
+            mapped = mapped_val if mapped_val is not None else self._suggest_attr(h)
+            self._row_cache.append((h, (mapped or '').strip()))
+        # Rows materialized so far; cells are created lazily as the user
+        # scrolls, so dialog-open cost is bounded by the viewport height
+        # rather than the header count.
+        self._populated_rows = set()
+        self.table.setSortingEnabled(False)
+        self.table.verticalScrollBar().valueChanged.connect(
+            lambda _value: self._populate_visible_rows())
+        self._populate_visible_rows()
         # Improve column sizing: left column content-sized, mapping column stretches, type column content-sized
-        header = self.table.horizontalHeader()
         header.setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeToContents)
         header.setSectionResizeMode(1, QtWidgets.QHeaderView.Stretch)
         header.setSectionResizeMode(2, QtWidgets.QHeaderView.ResizeToContents)
@@ -563,13 +874,12 @@ class AttributeMappingDialog(QtWidgets.QDialog):
             pass
         # Add a subtle bottom border to header row for visual separation
         try:
-            self.table.horizontalHeader().setStyleSheet('QHeaderView::section { border-bottom: 1px solid #999; padding: 4px; }')
+            header.setStyleSheet('QHeaderView::section { border-bottom: 1px solid #999; padding: 4px; }')
         except Exception:
             pass
         layout.addWidget(self.table)
 
         # Update Type column when the mapping cell is edited by the user
-        self._suppress_item_changed = False
         self.table.itemChanged.connect(self._on_table_item_changed)
 
         buttons = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.Ok | QtWidgets.QDialogButtonBox.Cancel)
@@ -585,6 +895,101 @@ class AttributeMappingDialog(QtWidgets.QDialog):
         layout.addWidget(self.remember_cb)
         layout.addWidget(buttons)
 
+        # Size the dialog once up front; get_mapping stays a pure accessor
+        # so repeated validate/accept calls don't re-query the screen or
+        # trigger relayouts.
+        self._fit_to_screen()
+
+    def _populate_row(self, r: int):
+        """Materialize the three cells for row `r` from the row cache."""
+        if r in self._populated_rows:
+            return
+        self._populated_rows.add(r)
+        h, mapped = self._row_cache[r]
+        item_h = QtWidgets.QTableWidgetItem(h)
+        item_h.setFlags(item_h.flags() & ~QtCore.Qt.ItemIsEditable)
+        item_m = QtWidgets.QTableWidgetItem(mapped)
+        # If this header is mapped to the system `id`, mark it read-only and clarify tooltip
+        kind = None
+        type_tip = ''
+        if mapped == 'id':
+            item_m.setFlags(item_m.flags() & ~QtCore.Qt.ItemIsEditable)
+            item_m.setToolTip('System-generated ID (read-only) — values will be ignored on import')
+            kind = 'id'
+            type_tip = 'population.id (read-only)'
+        else:
+            item_m.setToolTip('Suggested mapping; edit if needed')
+            # If the suggested mapping is population.name or population.id, show icon type
+            if mapped.startswith('population'):
+                kind = 'id' if mapped.endswith('.id') else 'name'
+                type_tip = f'population.{kind}'
+        type_item = QtWidgets.QTableWidgetItem('')
+        type_item.setFlags(type_item.flags() & ~QtCore.Qt.ItemIsEditable)
+        if kind is not None:
+            type_item.setData(_KIND_ROLE, kind)
+            type_item.setToolTip(type_tip)
+        # Scroll-time population runs with itemChanged live; suppress it
+        # for these programmatic writes.
+        blocker = QtCore.QSignalBlocker(self.table)
+        try:
+            self.table.setItem(r, 0, item_h)
+            self.table.setItem(r, 1, item_m)
+            self.table.setItem(r, 2, type_item)
+        finally:
+            del blocker
+
+    def _populate_visible_rows(self):
+        """Create cells for the rows currently in (or near) the viewport."""
+        total = len(self._row_cache)
+        if len(self._populated_rows) >= total:
+            return
+        row_h = self.table.verticalHeader().defaultSectionSize() or 24
+        first = max(self.table.rowAt(0), 0)
+        # Over-provision a couple of rows so small scroll steps don't
+        # expose blank cells before the signal fires.
+        visible = max(self.table.viewport().height() // row_h, 12) + 2
+        for r in range(first, min(first + visible, total)):
+            self._populate_row(r)
+
+    def _load_populations(self):
+        """Fill the fixed-population dropdown; idempotent, run on first show."""
+        if self._pops_loaded:
+            return
+        self._pops_loaded = True
+        # Sort once and keep the result; casefold handles Unicode names
+        # more correctly (and faster) than lower() for ordering.
+        # Decorate-sort-undecorate: casefold each name exactly once and
+        # let the sort compare plain tuples with no Python key callback.
+        self._sorted_pops = [
+            (name, pid)
+            for _, name, pid in sorted(
+                (name.casefold(), name, pid) for name, pid in self.pop_map.items())
+        ]
+        # Bulk-load the items in one model insert, then attach the id
+        # payloads; addItems emits a single rowsInserted instead of one
+        # per population.
+        self.population_fixed.addItems(
+            [f"{name} ({pid})" for name, pid in self._sorted_pops])
+        for i, (_name, pid) in enumerate(self._sorted_pops, start=1):
+            self.population_fixed.setItemData(i, pid)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # The viewport has its final size only once the dialog is laid
+        # out; finish the heavy fills after the first paint.
+        QtCore.QTimer.singleShot(0, self._finish_show)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        # Growing the dialog exposes rows without moving the scrollbar,
+        # so the valueChanged hook never fires for them; materialize the
+        # newly visible rows here.
+        self._populate_visible_rows()
+
+    def _finish_show(self):
+        self._load_populations()
+        self._populate_visible_rows()
+
     def _validate_mappings(self, mapping: dict) -> (bool, str):
         """Validate mapping rules. Returns (True, '') if valid, otherwise (False, message).
 
@@ -601,19 +1006,19 @@ class AttributeMappingDialog(QtWidgets.QDialog):
                     return False, f"Invalid mapping for '{hdr}': '{mapped}'. Population mappings must be 'population.id' or 'population.name'."
         return True, ''
 
-    def _on_accept(self):
-        # Build a tentative mapping and validate before accepting.
-        mapping, fixed_pop_id, fixed_enabled, _remember = self.get_mapping()
-        ok, msg = self._validate_mappings(mapping)
-        if not ok:
-            # Show a small resizable dialog with an inline help link to README
-            # Reminder: When changing mapping behavior or UI text, also update
-            # the README and `show_*_help` strings so users see accurate help.
-            # See DEVELOPMENT_RULES.md for the project rule about help docs.
+    def _show_mapping_error(self, msg: str):
+        """Show the invalid-mapping dialog, reusing one instance per dialog.
+
+        Reminder: When changing mapping behavior or UI text, also update
+        the README and `show_*_help` strings so users see accurate help.
+        See DEVELOPMENT_RULES.md for the project rule about help docs.
+        """
+        dlg = getattr(self, '_mapping_error_dlg', None)
+        if dlg is None:
             dlg = QtWidgets.QDialog(self)
             dlg.setWindowTitle('Invalid Mapping')
             lay = QtWidgets.QVBoxLayout(dlg)
-            lab = QtWidgets.QLabel(msg + "\nSee the <a href='file://" + str((Path(__file__).resolve().parent.parent / 'README.md').resolve()) + "'>README</a> for mapping help.")
+            lab = QtWidgets.QLabel()
             lab.setOpenExternalLinks(True)
             lab.setWordWrap(True)
             lay.addWidget(lab)
@@ -624,15 +1029,23 @@ class AttributeMappingDialog(QtWidgets.QDialog):
                 dlg.resize(700, 200)
             except Exception:
                 pass
-            dlg.exec()
+            self._mapping_error_dlg = dlg
+            self._mapping_error_label = lab
+        self._mapping_error_label.setText(
+            msg + f"\nSee the <a href='{_README_URL}'>README</a> for mapping help.")
+        dlg.exec()
+
+    def _on_accept(self):
+        # Build a tentative mapping and validate before accepting.
+        mapping, fixed_pop_id, fixed_enabled, _remember = self.get_mapping()
+        ok, msg = self._validate_mappings(mapping)
+        if not ok:
+            self._show_mapping_error(msg)
             return
         # All good — accept the dialog
         self.accept()
 
     def _on_table_item_changed(self, item: QtWidgets.QTableWidgetItem):
-        # Keep updates idempotent and avoid recursion when programmatically changing items
-        if self._suppress_item_changed:
-            return
         try:
             row = item.row()
             col = item.column()
@@ -640,12 +1053,16 @@ class AttributeMappingDialog(QtWidgets.QDialog):
             if col != 1:
                 return
             text = item.text().strip()
-            # Determine type for population mappings
-            if text.startswith('population'):
-                kind = 'id' if text.endswith('.id') else 'name' if text.endswith('.name') else ''
-            else:
-                kind = ''
-            self._suppress_item_changed = True
+            # Write-through to the Python-side row cache
+            if 0 <= row < len(self._row_cache):
+                self._row_cache[row] = (self._row_cache[row][0], text)
+            # Determine type for population mappings; only the two exact
+            # variants are valid, so a single hash probe classifies them.
+            kind = _KIND_FOR_MAPPED.get(text, '')
+            # Suppress itemChanged at the C++ level while mutating the
+            # Type cell; cheaper than re-entering this slot just to bail
+            # out on a Python-side flag.
+            blocker = QtCore.QSignalBlocker(self.table)
             try:
                 type_item = self.table.item(row, 2)
                 if not type_item:
@@ -653,13 +1070,13 @@ class AttributeMappingDialog(QtWidgets.QDialog):
                     self.table.setItem(row, 2, type_item)
                 # set icon for kind or clear icon
                 if kind:
-                    type_item.setIcon(QtGui.QIcon(_make_type_icon(kind)))
+                    type_item.setData(_KIND_ROLE, kind)
                     type_item.setToolTip(f'population.{kind}')
                 else:
-                    type_item.setIcon(QtGui.QIcon())
+                    type_item.setData(_KIND_ROLE, None)
                     type_item.setToolTip('')
             finally:
-                self._suppress_item_changed = False
+                del blocker
         except Exception:
             pass
 
@@ -673,24 +1090,26 @@ class AttributeMappingDialog(QtWidgets.QDialog):
         should contain the header -> population.id or population.name entry as appropriate.
         """
         mapping = {}
-        # First, incorporate selections from the required fields (if any)
-        def _apply_field(cb: QtWidgets.QComboBox, target_attr: str):
-            if cb.currentText() and cb.currentText() != '<None>':
-                mapping[cb.currentText()] = target_attr
-
-        _apply_field(self.username_field, 'username')
-        _apply_field(self.email_field, 'email')
-        _apply_field(self.given_field, 'name.given')
-        _apply_field(self.family_field, 'name.family')
+        # First, incorporate selections from the required fields (if any);
+        # each combo's currentText is read exactly once.
+        for cb, target_attr in (
+            (self.username_field, 'username'),
+            (self.email_field, 'email'),
+            (self.given_field, 'name.given'),
+            (self.family_field, 'name.family'),
+        ):
+            text = cb.currentText()
+            if text and text != '<None>':
+                mapping[text] = target_attr
 
         # population: if a CSV header was chosen, map that header to population.id
-        if self.population_field.currentText() and self.population_field.currentText() != '<None>':
-            mapping[self.population_field.currentText()] = 'population.id'
+        pop_header = self.population_field.currentText()
+        if pop_header and pop_header != '<None>':
+            mapping[pop_header] = 'population.id'
 
-        # Table entries override/augment the above
-        for r in range(self.table.rowCount()):
-            header = self.table.item(r, 0).text()
-            mapped = self.table.item(r, 1).text().strip()
+        # Table entries override/augment the above; read the Python-side
+        # cache maintained by itemChanged rather than 2N table.item() calls.
+        for header, mapped in self._row_cache:
             if mapped:
                 mapping[header] = mapped
 
@@ -717,6 +1136,8 @@ class AttributeMappingDialog(QtWidgets.QDialog):
         # nothing was chosen in the fixed dropdown by the user.
         try:
             if not fixed_pop_id and getattr(self, 'initial_fixed_pop_id', None):
+                # ensure the deferred dropdown fill has happened
+                self._load_populations()
                 # find the index that has this data
                 for i in range(self.population_fixed.count()):
                     if self.population_fixed.itemData(i) == self.initial_fixed_pop_id:
@@ -726,8 +1147,11 @@ class AttributeMappingDialog(QtWidgets.QDialog):
         except Exception:
             pass
 
-        # Resize dialog sensibly based on available screen space so mappings
-        # and mapped attributes are visible without manual resizing.
+        remember = self.remember_cb.isChecked() if self.remember_cb is not None else False
+        return mapping, fixed_pop_id, fixed_enabled, remember
+
+    def _fit_to_screen(self):
+        """Resize once to a sensible size for the available screen space."""
         try:
             screen = QtWidgets.QApplication.primaryScreen()
             geom = screen.availableGeometry()
@@ -743,63 +1167,149 @@ class AttributeMappingDialog(QtWidgets.QDialog):
             except Exception:
                 pass
 
-        return mapping, fixed_pop_id, fixed_enabled, bool(getattr(self, 'remember_cb', QtWidgets.QCheckBox()).isChecked())
+
+class ExportOptions(NamedTuple):
+    """Result of the export-options dialog.
+
+    A fixed-shape tuple is cheaper to allocate and access than a fresh
+    dict per accept; string indexing and .get() are kept so existing
+    dict-style call sites continue to work.
+    """
+    rows: str
+    only_visible_columns: bool
+    remember: bool
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
 
 
 class ExportOptionsDialog(QtWidgets.QDialog):
     """Dialog to choose export options: selected vs all rows, visible vs all columns.
 
-    Returns a dict: { 'rows': 'selected'|'all', 'only_visible_columns': bool, 'remember': bool }
+    Returns an `ExportOptions` tuple with fields `rows` ('selected'|'all'),
+    `only_visible_columns` and `remember`; string indexing still works.
     """
-    def __init__(self, has_selection: bool, only_visible_default: bool = True, prefer_selected_default: bool = True, parent=None):
+    # One instance per process; the widget tree never changes, so reopen
+    # is configure + exec rather than a full rebuild.
+    _instance = None
+
+    def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle('Export Options')
         self.setModal(True)
         layout = QtWidgets.QVBoxLayout(self)
 
         self.setMinimumSize(420, 180)
-        self.row_group = QtWidgets.QButtonGroup(self)
+        # Sibling radio buttons are already mutually exclusive; track the
+        # row mode as a plain attribute updated on toggle so get_options
+        # reads it without crossing into Qt.
         self.rb_sel = QtWidgets.QRadioButton('Export only selected rows')
         self.rb_all = QtWidgets.QRadioButton('Export all rows')
-        self.row_group.addButton(self.rb_sel)
-        self.row_group.addButton(self.rb_all)
+        self._rows = 'all'
+        self.rb_sel.toggled.connect(self._on_rows_toggled)
+
+        self.note = QtWidgets.QLabel('No rows selected — "Export only selected rows" is disabled.')
+        # Tint via the palette; setStyleSheet would run the QSS parser and
+        # invalidate style caches for the whole dialog just to grey a label.
+        pal = self.note.palette()
+        pal.setColor(QtGui.QPalette.WindowText, QtGui.QColor(0x66, 0x66, 0x66))
+        self.note.setPalette(pal)
+        self.note.hide()
+
+        self.only_visible_cb = QtWidgets.QCheckBox('Export only visible columns')
+        self.remember_cb = QtWidgets.QCheckBox('Remember these choices for this profile')
+        for w in (self.note, self.rb_sel, self.rb_all, self.only_visible_cb, self.remember_cb):
+            layout.addWidget(w)
+
+        btns = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.Ok | QtWidgets.QDialogButtonBox.Cancel)
+        btns.accepted.connect(self.accept)
+        btns.rejected.connect(self.reject)
+        layout.addWidget(btns)
+
+    def configure(self, has_selection: bool, only_visible_default: bool = True, prefer_selected_default: bool = True):
+        """Reset the stateful bits for a fresh open."""
+        self.rb_sel.setEnabled(has_selection)
         if has_selection:
             if prefer_selected_default:
                 self.rb_sel.setChecked(True)
             else:
                 self.rb_all.setChecked(True)
         else:
-            self.rb_sel.setEnabled(False)
             self.rb_all.setChecked(True)
+        self.note.setVisible(not has_selection)
+        self.only_visible_cb.setChecked(bool(only_visible_default))
+        self.remember_cb.setChecked(False)
 
-        if not has_selection:
-            note = QtWidgets.QLabel('No rows selected — "Export only selected rows" is disabled.')
-            note.setStyleSheet('color: #666;')
-            layout.addWidget(note)
+    @classmethod
+    def open_for(cls, has_selection: bool, only_visible_default: bool = True,
+                 prefer_selected_default: bool = True, parent=None):
+        """Show the shared dialog and return its options, or None on cancel."""
+        if cls._instance is None:
+            cls._instance = cls(parent)
+        dlg = cls._instance
+        dlg.configure(has_selection, only_visible_default, prefer_selected_default)
+        if dlg.exec() != QtWidgets.QDialog.Accepted:
+            return None
+        return dlg.get_options()
 
-        layout.addWidget(self.rb_sel)
-        layout.addWidget(self.rb_all)
+    def _on_rows_toggled(self, checked: bool):
+        self._rows = 'selected' if checked and self.rb_sel.isEnabled() else 'all'
 
-        self.only_visible_cb = QtWidgets.QCheckBox('Export only visible columns')
-        self.only_visible_cb.setChecked(bool(only_visible_default))
-        layout.addWidget(self.only_visible_cb)
+    def get_options(self) -> ExportOptions:
+        return ExportOptions(
+            self._rows,
+            self.only_visible_cb.isChecked(),
+            self.remember_cb.isChecked())
 
-        self.remember_cb = QtWidgets.QCheckBox('Remember these choices for this profile')
-        self.remember_cb.setChecked(False)
-        layout.addWidget(self.remember_cb)
 
-        btns = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.Ok | QtWidgets.QDialogButtonBox.Cancel)
-        btns.accepted.connect(self.accept)
-        btns.rejected.connect(self.reject)
-        layout.addWidget(btns)
+    # Shared store for remembered export choices, keyed per profile. Kept
+    # lazy so importing this module does not touch the settings backend.
+    _settings = None
 
-    def get_options(self) -> dict:
-        rows = 'selected' if self.rb_sel.isChecked() and self.rb_sel.isEnabled() else 'all'
-        return {
-            'rows': rows,
-            'only_visible_columns': bool(self.only_visible_cb.isChecked()),
-            'remember': bool(self.remember_cb.isChecked())
-        }
+    @classmethod
+    def _get_settings(cls) -> QtCore.QSettings:
+        if cls._settings is None:
+            cls._settings = QtCore.QSettings('p1-usermanager', 'export')
+        return cls._settings
+
+    @classmethod
+    def get_or_remembered(cls, profile_key: str, has_selection: bool,
+                          only_visible_default: bool = True,
+                          prefer_selected_default: bool = True,
+                          parent=None):
+        """Return export options, skipping the dialog when remembered.
+
+        If the user previously ticked "Remember these choices" for this
+        profile and the remembered record is still compatible with the
+        current selection state, the options come straight from QSettings
+        with no widget construction or modal event loop. Returns None when
+        the dialog is shown and cancelled.
+        """
+        settings = cls._get_settings()
+        key = f'export/{profile_key}'
+        if profile_key and settings.value(f'{key}/remember', False, type=bool):
+            rows = settings.value(f'{key}/rows', 'all')
+            if has_selection or rows == 'all':
+                return ExportOptions(
+                    rows,
+                    settings.value(f'{key}/only_visible', True, type=bool),
+                    True)
+        opts = cls.open_for(has_selection, only_visible_default, prefer_selected_default, parent)
+        if opts is None:
+            return None
+        if profile_key:
+            if opts.get('remember'):
+                settings.setValue(f'{key}/remember', True)
+                settings.setValue(f'{key}/rows', opts.get('rows'))
+                settings.setValue(f'{key}/only_visible', bool(opts.get('only_visible_columns')))
+            else:
+                settings.setValue(f'{key}/remember', False)
+        return opts
 
 
 class NewProfileDialog(QtWidgets.QDialog):
@@ -809,7 +1319,8 @@ class NewProfileDialog(QtWidgets.QDialog):
         super().__init__(parent)
         self.setWindowTitle('Create New Profile')
         self.setModal(True)
-        self.existing_profiles = existing_profiles
+        # Set gives O(1) membership for the duplicate-name check
+        self.existing_profiles = set(existing_profiles)
         
         # Set dialog size
         dpi_scale = get_dpi_scale()
@@ -948,7 +1459,7 @@ class NewProfileDialog(QtWidgets.QDialog):
         secret = self.client_secret_edit.text().strip()
         
         # Partial validation: if any field is filled, recommend filling all
-        filled_fields = sum([bool(env_id), bool(client_id), bool(secret)])
+        filled_fields = bool(env_id) + bool(client_id) + bool(secret)
         if 0 < filled_fields < 3:
             reply = QtWidgets.QMessageBox.question(
                 self,
@@ -974,6 +1485,23 @@ class NewProfileDialog(QtWidgets.QDialog):
         )
 
 
+_ACTIVE_ROLE = QtCore.Qt.UserRole + 1
+
+
+class _ActiveMarkDelegate(QtWidgets.QStyledItemDelegate):
+    """Appends the " (active)" marker to the active profile at paint time.
+
+    Keeping the marker out of the item text means the display string is
+    always the raw profile name and consumers never have to parse the
+    suffix back out.
+    """
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        if index.data(_ACTIVE_ROLE):
+            option.text = f"{option.text} (active)"
+
+
 class ProfileManagerDialog(QtWidgets.QDialog):
     """Dialog to view, select, and delete profiles.
     
@@ -1008,6 +1536,7 @@ class ProfileManagerDialog(QtWidgets.QDialog):
         # List widget for profiles
         self.profile_list = QtWidgets.QListWidget()
         self.profile_list.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.profile_list.setItemDelegate(_ActiveMarkDelegate(self.profile_list))
         self.profile_list.itemSelectionChanged.connect(self.on_selection_changed)
         layout.addWidget(self.profile_list)
         
@@ -1061,24 +1590,52 @@ class ProfileManagerDialog(QtWidgets.QDialog):
     
     def populate_profiles(self):
         """Populate the profile list widget with all available profiles."""
-        self.profile_list.clear()
-        # Filter out __meta__ key
-        profile_names = [k for k in self.profiles_dict.keys() if k != '__meta__']
-        
-        for name in sorted(profile_names):
-            item = QtWidgets.QListWidgetItem(name)
-            # Highlight current profile
-            if name == self.current_profile:
-                font = item.font()
-                font.setBold(True)
-                item.setFont(font)
-                item.setText(f"{name} (active)")
-            self.profile_list.addItem(item)
-        
+        # Suppress repaints and selection-change signals while the list is
+        # rebuilt; a single selection update fires once at the end.
+        self.profile_list.setUpdatesEnabled(False)
+        blocker = QtCore.QSignalBlocker(self.profile_list)
+        try:
+            self.profile_list.clear()
+            # Filter out __meta__ key; keep the sorted names so later single
+            # additions can insert incrementally instead of rebuilding.
+            self._profile_names = sorted(
+                k for k in self.profiles_dict.keys() if k != '__meta__')
+
+            for name in self._profile_names:
+                item = QtWidgets.QListWidgetItem(name)
+                # Keep the raw name on the item; consumers read it from
+                # UserRole instead of parsing the display text.
+                item.setData(QtCore.Qt.UserRole, name)
+                # Highlight current profile; the " (active)" marker is
+                # appended by the delegate at paint time so the item text
+                # stays the raw name.
+                if name == self.current_profile:
+                    font = item.font()
+                    font.setBold(True)
+                    item.setFont(font)
+                    item.setData(_ACTIVE_ROLE, True)
+                self.profile_list.addItem(item)
+        finally:
+            del blocker
+            self.profile_list.setUpdatesEnabled(True)
+
         # Select the first item if available
         if self.profile_list.count() > 0:
             self.profile_list.setCurrentRow(0)
-    
+
+    def _insert_profile_item(self, name: str) -> int:
+        """Insert a single profile item at its sorted position.
+
+        Avoids the full clear-and-rebuild of `populate_profiles` when only
+        one profile was added. Returns the row the item was inserted at.
+        """
+        idx = bisect.bisect_left(self._profile_names, name)
+        self._profile_names.insert(idx, name)
+        item = QtWidgets.QListWidgetItem(name)
+        item.setData(QtCore.Qt.UserRole, name)
+        self.profile_list.insertItem(idx, item)
+        return idx
+
     def on_selection_changed(self):
         """Update details when selection changes."""
         selected_items = self.profile_list.selectedItems()
@@ -1088,8 +1645,8 @@ class ProfileManagerDialog(QtWidgets.QDialog):
             return
         
         item = selected_items[0]
-        profile_name = item.text().replace(" (active)", "")
-        
+        profile_name = item.data(QtCore.Qt.UserRole)
+
         self.delete_btn.setEnabled(True)
         self.show_profile_details(profile_name)
     
@@ -1122,8 +1679,8 @@ class ProfileManagerDialog(QtWidgets.QDialog):
             return
         
         item = selected_items[0]
-        profile_name = item.text().replace(" (active)", "")
-        
+        profile_name = item.data(QtCore.Qt.UserRole)
+
         # Prevent deleting the current active profile
         if profile_name == self.current_profile:
             QtWidgets.QMessageBox.warning(
@@ -1147,7 +1704,9 @@ class ProfileManagerDialog(QtWidgets.QDialog):
             if profile_name in self.profiles_dict:
                 del self.profiles_dict[profile_name]
                 self.deleted_profiles.append(profile_name)
-            
+            if profile_name in self._profile_names:
+                self._profile_names.remove(profile_name)
+
             # Remove from list widget
             row = self.profile_list.currentRow()
             self.profile_list.takeItem(row)
@@ -1165,11 +1724,8 @@ class ProfileManagerDialog(QtWidgets.QDialog):
     
     def create_new_profile(self):
         """Prompt user to create a new profile with connection details."""
-        # Get list of existing profile names
-        existing_profiles = [k for k in self.profiles_dict.keys() if k != '__meta__']
-        
-        # Show the new profile dialog
-        dialog = NewProfileDialog(existing_profiles, self)
+        # The cached sorted name list already excludes __meta__
+        dialog = NewProfileDialog(self._profile_names, self)
         if dialog.exec() != QtWidgets.QDialog.Accepted:
             return
         
@@ -1188,15 +1744,10 @@ class ProfileManagerDialog(QtWidgets.QDialog):
         if secret:
             self.new_profile_credentials = (env_id, client_id, secret)
         
-        # Refresh the list and select new profile
-        self.populate_profiles()
-        
-        # Find and select the new profile
-        for i in range(self.profile_list.count()):
-            item = self.profile_list.item(i)
-            if item.text() == profile_name:
-                self.profile_list.setCurrentRow(i)
-                break
+        # Insert the new profile at its sorted position and select it;
+        # no need to rebuild the whole list for a single addition.
+        idx = self._insert_profile_item(profile_name)
+        self.profile_list.setCurrentRow(idx)
         
         # Show success message and offer to connect if credentials are complete
         if env_id and client_id and secret:
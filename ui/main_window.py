@@ -1,13 +1,18 @@
 import json
+import os
 from pathlib import Path
 from datetime import datetime
 import asyncio
 import functools
-import zipfile
-import shutil
 import sys
 import platform
 
+# Optional fast JSON backend; used for profiles.json when available.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # If this file is executed directly (e.g. via the editor), ensure the
 # project root is on `sys.path` so local packages like `api` and `workers`
 # can be imported using absolute imports.
@@ -16,7 +21,6 @@ _PROJECT_ROOT = _THIS_FILE.parent.parent
 if str(_PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(_PROJECT_ROOT))
 
-import keyring
 from PySide6 import QtWidgets, QtCore, QtGui
 
 import api.client as api_client
@@ -46,96 +50,36 @@ APP_NAME = "UserManager"
 APP_VERSION = "0.6"
 
 
-# Predefined help texts to avoid reallocating large strings on each call.
-# Reminder: Update the UI help texts (show_*_help and related strings)
+# Help texts live in ui/help/*.txt and are loaded lazily on first use;
+# the lru_cache means each file is read at most once per run.
+# Reminder: Update the UI help texts (ui/help/*.txt and show_*_help)
 # whenever you change features or behavior. See DEVELOPMENT_RULES.md
 # for the project rule about keeping help docs in sync.
-HELP_CONFIG = """
-Configuration Tab Help:
-
-Connecting to PingOne:
-
-1. Obtain your PingOne Environment ID, Client ID, and Client Secret from the 
-   PingOne admin console.
-
-2. Select an existing profile or create a new one using the "Active Profile" dropdown.
+@functools.lru_cache(maxsize=None)
+def _keyring():
+    """Import keyring on first credential access.
 
-3. Enter the Environment ID, Client ID, and Client Secret in the respective fields. 
-   The Client Secret is stored securely in your system's keyring.
-
-4. Click "Save Profile" to persist the credentials and settings.
-
-5. Click "Connect & Sync" to authenticate and fetch users from PingOne.
-
-Profile Settings:
-- Credentials (Env ID, Client ID, Secret) are saved per-profile.
-- Column selection and order are saved per-profile.
-- Import/export preferences are saved per-profile when "Remember" is checked.
-- The last active profile can auto-connect on startup (see Settings menu).
+    Backend discovery makes the import noticeably slow on some
+    platforms, so it is deferred until a profile actually needs it.
+    """
+    import keyring
+    return keyring
 
-Managing Profiles:
-- Use File → Manage Profiles (Cmd/Ctrl+Shift+M) to view all saved profiles.
-- The Profile Manager shows environment IDs, client IDs, and column counts.
-- Delete unwanted profiles from the Profile Manager dialog.
-- The currently active profile cannot be deleted; switch profiles first.
 
-Status Bar:
-- Shows live API call summaries when "Show API calls in status bar" is enabled.
-- Displays connection status and recent operation results.
-- API call logging can be toggled from the Settings menu.
+@functools.lru_cache(maxsize=None)
+def _help(key: str) -> str:
+    """Return the help text stored in ui/help/<key>.txt."""
+    return (_THIS_FILE.parent / 'help' / f'{key}.txt').read_text(encoding='utf-8')
 
-Settings Menu:
-- Dark Mode: Toggle between light and dark themes (Cmd+D / Ctrl+D).
-- Theme preference is saved and restored on startup.
-- Dark mode applies a comfortable color scheme for low-light environments.
 
-See the User Management help for information about working with users.
-"""
+class _ApiEventBridge(QtCore.QObject):
+    """Carries live API events from worker threads onto the GUI thread.
 
-HELP_USER = """
-User Management Tab Help:
-
-Viewing Users:
-- The table displays users with selected columns (UUID, username, name, etc.).
-- Click "Refresh" to reload users from PingOne.
-- Use "Columns" to select which attributes to display.
-- Column selection and order are saved per-profile.
-
-Editing Users:
-- Double-click on the UUID or username to open the edit dialog.
-- Single-click selects a row without opening the editor.
-- Double-click on email addresses to open your email client.
-- Double-click on JSON-formatted attributes (name, address, etc.) to view/edit in a separate window.
-- The context menu (right-click) offers "Delete Selected" only.
-
-Importing Users:
-- Click "Import CSV" or "Import LDIF" to bulk-create or update users.
-- The mapping dialog lets you map file headers to PingOne attributes:
-  • Required fields: username, email, name.given, name.family
-  • The 'enabled' field is a dropdown (true/false)
-  • You can assign a fixed population to all imported users
-  • Check "Remember mapping for this profile" to save mappings
-- Usernames are normalized (whitespace trimmed, case-insensitive comparison).
-- If a username already exists on the server, the import updates that user instead of creating a duplicate.
-- Local JSON Schema validation is performed if jsonschema is installed and user_schema.json exists.
-
-Exporting Users:
-- Click "Export CSV" or "Export LDIF" to save users.
-- Choose to export all users or selected rows only.
-- Choose to export all columns or only visible columns.
-- Check "Remember these choices" to save export preferences per-profile.
-
-Deleting Users:
-- Select one or more rows and click "Delete Selected" or use the context menu.
-- A confirmation dialog will appear before deletion.
-- Progress is shown for bulk deletions.
-
-Logs Menu:
-- "Show Log Files" displays connection and API logs in a dialog.
-- "Reset Log" clears an individual log file.
-- "Clear All Logs" empties all log files at once.
-- "Archive Logs" creates a timestamped .zip archive of all logs, with optional rotation (truncate originals after archiving).
-"""
+    api_client's listener hook calls `event.emit` from whatever thread
+    produced the event; the cross-thread connection queues the delivery
+    onto the GUI thread, so no polling timer is needed.
+    """
+    event = QtCore.Signal(str)
 
 
 class MainWindow(QtWidgets.QMainWindow):
@@ -186,7 +130,19 @@ class MainWindow(QtWidgets.QMainWindow):
         
         self.threadpool = QtCore.QThreadPool()
         self.config_file, self.users_cache, self.pop_map = Path("profiles.json"), [], {}
+        # id -> user dict mirroring users_cache, so per-click lookups are
+        # hash probes instead of linear scans over the whole tenant.
+        self._users_by_id = {}
+        # Prototype cell item; populate loops clone() it so flags and
+        # role defaults are copied instead of re-initialized per cell.
+        self._item_proto = QtWidgets.QTableWidgetItem()
         self.columns = []
+        # Caches derived from self.columns; rebuilt by _recompute_headers.
+        self._header_labels = []
+        self._col_index = {}
+        # Per-row lowercase text joined across columns, built lazily for
+        # the filter box and dropped whenever the table contents change.
+        self._filter_index = None
         # Default column order: UUID, first name, last name, email, population.
         # This matches the requested default and ensures the UUID is always visible
         # as the left-most column.
@@ -425,7 +381,13 @@ class MainWindow(QtWidgets.QMainWindow):
             btn_del.setToolTip("Delete selected users (Delete)")
         
         self.search_bar = QtWidgets.QLineEdit(); self.search_bar.setPlaceholderText("Filter...")
-        self.search_bar.textChanged.connect(self.filter_table)
+        # Debounce filtering so fast typing triggers one pass at
+        # quiescence rather than a full-table scan per keystroke.
+        self._filter_timer = QtCore.QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self.filter_table)
+        self.search_bar.textChanged.connect(self._filter_timer.start)
         # Create a shortcut to focus the search bar (QLineEdit doesn't have setShortcut method)
         search_shortcut = QtGui.QShortcut(QtGui.QKeySequence(SHORTCUT_MODIFIER | QtCore.Qt.Key.Key_L), self)
         search_shortcut.activated.connect(self.search_bar.setFocus)
@@ -481,6 +443,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self.u_table.horizontalHeader().setSectionsMovable(True)
         self.u_table.horizontalHeader().sectionMoved.connect(self.on_column_moved)
         self.u_table.horizontalHeader().sectionResized.connect(self.on_column_resized)
+        # Sorting reorders rows, so the cached filter strings go stale
+        self.u_table.horizontalHeader().sortIndicatorChanged.connect(self._invalidate_filter_index)
         
         self.prog = QtWidgets.QProgressBar(); self.prog.hide()
         user_lay.addLayout(toolbar); user_lay.addWidget(self.prog); user_lay.addWidget(self.u_table)
@@ -499,11 +463,11 @@ class MainWindow(QtWidgets.QMainWindow):
             self.statusBar().addPermanentWidget(self.api_calls_label)
         except Exception:
             pass
-        # Timer to poll live API events and display them in the status area
-        self.api_timer = QtCore.QTimer(self)
-        self.api_timer.setInterval(1000)
-        self.api_timer.timeout.connect(self._poll_api_events)
-        self.api_timer.start()
+        # Live API events arrive push-style via the bridge signal instead
+        # of a 1 Hz polling timer: no idle wakeups, no 1 s display lag.
+        self._api_event_bridge = _ApiEventBridge(self)
+        self._api_event_bridge.event.connect(self._on_api_event, QtCore.Qt.QueuedConnection)
+        api_client.set_live_event_listener(self._api_event_bridge.event.emit)
 
         # Wire auto-connect checkbox to persist app-level setting
         try:
@@ -530,9 +494,26 @@ class MainWindow(QtWidgets.QMainWindow):
     # --- Profile Methods ---
     def _read_config(self):
         if self.config_file.exists():
+            if orjson is not None:
+                return orjson.loads(self.config_file.read_bytes())
             with open(self.config_file, 'r') as f: return json.load(f)
         return {}
 
+    def _write_config(self, cfg: dict):
+        """Serialize `cfg` to profiles.json atomically.
+
+        The payload is written to a sibling temp file and swapped in with
+        os.replace, so a crash mid-write cannot leave a torn config.
+        orjson is used when available for its faster encoder.
+        """
+        if orjson is not None:
+            payload = orjson.dumps(cfg, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(cfg, indent=4).encode('utf-8')
+        tmp = self.config_file.with_suffix('.tmp')
+        tmp.write_bytes(payload)
+        os.replace(tmp, self.config_file)
+
     def restore_window_geometry(self):
         """Restore saved window geometry from profiles.json __meta__ section."""
         try:
@@ -629,8 +610,7 @@ class MainWindow(QtWidgets.QMainWindow):
                     cfg['__meta__']['window_x'] = self.x()
                     cfg['__meta__']['window_y'] = self.y()
             
-            with open(self.config_file, 'w') as f:
-                json.dump(cfg, f, indent=4)
+            self._write_config(cfg)
         except Exception:
             pass
 
@@ -649,9 +629,11 @@ class MainWindow(QtWidgets.QMainWindow):
         migrated = self._migrate_profiles_columns(cfg)
         if migrated:
             # Persist the migrated config back to disk so the change is
-            # visible on subsequent runs.
-            with open(self.config_file, 'w') as f:
-                json.dump(cfg, f, indent=4)
+            # visible on subsequent runs. The in-memory cfg is already
+            # migrated, so the write does not need to block first paint;
+            # hand it to the threadpool (the atomic temp-file swap in
+            # _write_config keeps a concurrent reader safe).
+            self.threadpool.start(functools.partial(self._write_config, dict(cfg)))
 
         self.profile_list.blockSignals(True); self.profile_list.clear()
         # Populate only profile names (filter out any __meta__ app-level keys)
@@ -739,7 +721,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if name in p:
             self.env_id.setText(p[name].get("env_id", ""))
             self.cl_id.setText(p[name].get("cl_id", ""))
-            self.cl_sec.setText(keyring.get_password("PingOneUM", name) or "")
+            self.cl_sec.setText(_keyring().get_password("PingOneUM", name) or "")
             # Create a copy of the columns list to avoid shared references
             self.selected_columns = list(p[name].get("columns", self.default_columns.copy()))
             self.column_widths = p[name].get("column_widths", {}).copy()
@@ -772,8 +754,8 @@ class MainWindow(QtWidgets.QMainWindow):
             p[name]["column_widths"] = self.column_widths
             # Save per-profile UI options
             p[name]['status_show_api_calls'] = bool(getattr(self, 'show_api_calls_cb', QtWidgets.QCheckBox()).isChecked())
-            with open(self.config_file, 'w') as f: json.dump(p, f, indent=4)
-            keyring.set_password("PingOneUM", name, self.cl_sec.text()); self.load_profiles_from_disk()
+            self._write_config(p)
+            _keyring().set_password("PingOneUM", name, self.cl_sec.text()); self.load_profiles_from_disk()
 
     def save_app_settings(self):
         """Persist app-level settings (auto-connect, theme) to config file under __meta__."""
@@ -783,8 +765,7 @@ class MainWindow(QtWidgets.QMainWindow):
             meta['auto_connect_last'] = bool(self.auto_connect_cb.isChecked())
             meta['theme'] = self.theme_manager.get_current_theme()
             cfg['__meta__'] = meta
-            with open(self.config_file, 'w') as f:
-                json.dump(cfg, f, indent=4)
+            self._write_config(cfg)
         except Exception:
             pass
 
@@ -798,8 +779,7 @@ class MainWindow(QtWidgets.QMainWindow):
             if name not in cfg:
                 cfg[name] = {}
             cfg[name]['status_show_api_calls'] = bool(self.show_api_calls_cb.isChecked())
-            with open(self.config_file, 'w') as f:
-                json.dump(cfg, f, indent=4)
+            self._write_config(cfg)
         except Exception:
             pass
 
@@ -835,11 +815,11 @@ class MainWindow(QtWidgets.QMainWindow):
                     QtWidgets.QMessageBox.information(self, "Edit User", "No user selected.")
                     return
                 row = sel[0].row()
-                id_col = self.columns.index('id') if 'id' in self.columns else -1
+                id_col = self._col_index.get('id', -1)
                 if id_col == -1:
                     return
                 user_id = self.u_table.item(row, id_col).text()
-            user_obj = next((u for u in self.users_cache if u.get('id') == user_id), None)
+            user_obj = self._users_by_id.get(user_id)
             if not user_obj:
                 QtWidgets.QMessageBox.information(self, "Edit User", "User not found in cache.")
                 return
@@ -857,24 +837,19 @@ class MainWindow(QtWidgets.QMainWindow):
         except Exception as e:
             QtWidgets.QMessageBox.critical(self, "Edit User Error", str(e))
 
-    def _poll_api_events(self):
-        """Poll `api.client` live events and display them in the UI when enabled for profile."""
+    def _on_api_event(self, event: str):
+        """Display a live API event in the status area when enabled for profile.
+
+        Invoked via the bridge signal whenever `api.client` records an
+        event. The per-profile option is mirrored by the checkbox (kept
+        in sync by `load_selected_profile`), so no config read is needed
+        per event.
+        """
         try:
-            events = api_client.get_and_clear_live_events()
-            if not events:
-                return
-            # Only display when current profile has enabled the option
-            name = self.profile_list.currentText()
-            cfg = self._read_config()
-            show = False
-            if name in cfg:
-                show = bool(cfg[name].get('status_show_api_calls', False))
-            if show:
-                # display most recent event (shortened)
-                txt = events[-1]
-                if len(txt) > 120:
-                    txt = txt[:120] + '...'
-                self.api_calls_label.setText(txt)
+            if self.show_api_calls_cb.isChecked():
+                if len(event) > 120:
+                    event = event[:120] + '...'
+                self.api_calls_label.setText(event)
             else:
                 self.api_calls_label.setText("")
         except Exception:
@@ -931,8 +906,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 meta = cfg.get('__meta__', {})
                 meta['last_working_profile'] = prof_name
                 cfg['__meta__'] = meta
-                with open(self.config_file, 'w') as f:
-                    json.dump(cfg, f, indent=4)
+                self._write_config(cfg)
             except Exception:
                 pass
         else:
@@ -960,10 +934,9 @@ class MainWindow(QtWidgets.QMainWindow):
             try:
                 # Remove saved profile and associated keyring secret
                 del p[name]
-                with open(self.config_file, 'w') as f:
-                    json.dump(p, f, indent=4)
+                self._write_config(p)
                 try:
-                    keyring.delete_password("PingOneUM", name)
+                    _keyring().delete_password("PingOneUM", name)
                 except Exception:
                     pass
                 self.load_profiles_from_disk()
@@ -992,15 +965,13 @@ class MainWindow(QtWidgets.QMainWindow):
                     return False
                 
                 # Save the config and credentials first
-                with open(self.config_file, 'w') as f:
-                    json.dump(cfg, f, indent=4)
+                self._write_config(cfg)
                 
                 # Save credentials to keyring
-                import keyring
                 env_id, client_id, secret = new_credentials
                 try:
                     if secret:
-                        keyring.set_password("PingOneUM", new_profile, secret)
+                        _keyring().set_password("PingOneUM", new_profile, secret)
                 except Exception:
                     pass
                 
@@ -1050,16 +1021,14 @@ class MainWindow(QtWidgets.QMainWindow):
             # Save if there were any changes (and connection wasn't already tested)
             if (deleted or new_profile) and not auto_connect:
                 # Save updated config
-                with open(self.config_file, 'w') as f:
-                    json.dump(cfg, f, indent=4)
+                self._write_config(cfg)
                 
                 # Save credentials to keyring if provided
                 if new_profile and new_credentials:
-                    import keyring
                     env_id, client_id, secret = new_credentials
                     try:
                         if secret:
-                            keyring.set_password("PingOneUM", new_profile, secret)
+                            _keyring().set_password("PingOneUM", new_profile, secret)
                     except Exception as e:
                         QtWidgets.QMessageBox.warning(
                             self,
@@ -1096,10 +1065,9 @@ class MainWindow(QtWidgets.QMainWindow):
             
             # Clean up keyring entries for deleted profiles
             if deleted:
-                import keyring
                 for profile_name in deleted:
                     try:
-                        keyring.delete_password("PingOneUM", profile_name)
+                        _keyring().delete_password("PingOneUM", profile_name)
                     except Exception:
                         pass
         except Exception as e:
@@ -1117,11 +1085,13 @@ class MainWindow(QtWidgets.QMainWindow):
         except Exception:
             pass
         self.pop_map, self.users_cache = data['pop_map'], data['users']
+        self._users_by_id = {u.get('id'): u for u in self.users_cache if u.get('id')}
         
         self.all_columns = self._get_all_columns(self.users_cache)
         # Use saved column configuration, filtering to only columns present in dataset
         self.columns = [c for c in self.selected_columns if c in self.all_columns]
-        
+        self._recompute_headers()
+
         # Disable sorting during table rebuild for better performance
         self.u_table.setSortingEnabled(False)
         self.u_table.setColumnCount(len(self.columns))
@@ -1132,11 +1102,13 @@ class MainWindow(QtWidgets.QMainWindow):
         for row_idx, user in enumerate(self.users_cache):
             for col_idx, col in enumerate(self.columns):
                 value = self._get_value(user, col)
-                item = QtWidgets.QTableWidgetItem(str(value))
+                item = self._item_proto.clone()
+                item.setText(str(value))
                 item.setData(QtCore.Qt.UserRole, value)
                 self.u_table.setItem(row_idx, col_idx, item)
         
         self.u_table.setSortingEnabled(True)
+        self._invalidate_filter_index()
         msg = f"Loaded {data['user_count']} users, {data['pop_count']} populations"
         self.status_label.setText(msg)
         try:
@@ -1196,7 +1168,7 @@ class MainWindow(QtWidgets.QMainWindow):
     def delete_selected_users(self):
         rows = self.u_table.selectionModel().selectedRows()
         if not rows: return
-        id_col = self.columns.index('id') if 'id' in self.columns else -1
+        id_col = self._col_index.get('id', -1)
         if id_col == -1: return
         uids = [self.u_table.item(r.row(), id_col).text() for r in rows]
         if QtWidgets.QMessageBox.question(self, "Delete", f"Delete {len(uids)} users?") == QtWidgets.QMessageBox.Yes:
@@ -1206,11 +1178,33 @@ class MainWindow(QtWidgets.QMainWindow):
             w.signals.finished.connect(lambda r: (self.prog.hide(), self.refresh_users()))
             self.threadpool.start(w)
 
+    def _invalidate_filter_index(self, *_args):
+        """Drop the cached per-row filter strings; rebuilt on next filter."""
+        self._filter_index = None
+
+    def _build_filter_index(self):
+        """Join each row's cell text into one lowercase string.
+
+        Filtering then does a single substring test per row instead of
+        fetching and lowercasing every QTableWidgetItem on each call.
+        """
+        tbl = self.u_table
+        cols = range(tbl.columnCount())
+        self._filter_index = [
+            "\t".join((tbl.item(r, c).text() if tbl.item(r, c) else "") for c in cols).lower()
+            for r in range(tbl.rowCount())
+        ]
+
     def filter_table(self):
         txt = self.search_bar.text().lower()
-        for i in range(self.u_table.rowCount()):
-            match = any(txt in (self.u_table.item(i, j).text() or "").lower() for j in range(self.u_table.columnCount()))
-            self.u_table.setRowHidden(i, not match)
+        if self._filter_index is None or len(self._filter_index) != self.u_table.rowCount():
+            self._build_filter_index()
+        self.u_table.setUpdatesEnabled(False)
+        try:
+            for i, row_text in enumerate(self._filter_index):
+                self.u_table.setRowHidden(i, txt not in row_text)
+        finally:
+            self.u_table.setUpdatesEnabled(True)
 
     def toggle_json_editing(self):
         """Toggle JSON editing mode."""
@@ -1271,6 +1265,11 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def show_log_files(self):
         """Display a small dialog listing the log files and allow opening them."""
+        # Push buffered log records to disk so the opened files are current
+        try:
+            api_client.flush_logs()
+        except Exception:
+            pass
         logs = [
             ("API Calls Log", getattr(api_client, 'LOG_FILE', Path('api_calls.log'))),
             ("Connection Log", getattr(api_client, 'CONNECTION_LOG', Path('connection_errors.log'))),
@@ -1300,6 +1299,12 @@ class MainWindow(QtWidgets.QMainWindow):
                 try:
                     if QtWidgets.QMessageBox.question(self, "Reset Log", f"Truncate {path}? This cannot be undone.") != QtWidgets.QMessageBox.Yes:
                         return
+                    # Drain buffers first so stale records are not flushed
+                    # into the freshly truncated file later.
+                    try:
+                        api_client.flush_logs()
+                    except Exception:
+                        pass
                     with open(path, 'w', encoding='utf-8'):
                         pass
                     QtWidgets.QMessageBox.information(self, "Reset Log", f"Truncated {path}")
@@ -1413,6 +1418,12 @@ class MainWindow(QtWidgets.QMainWindow):
                 return
             if QtWidgets.QMessageBox.question(self, "Reset Log", f"Truncate {p}? This cannot be undone.") != QtWidgets.QMessageBox.Yes:
                 return
+            # Drain buffers so pending records are not flushed into the
+            # freshly truncated file later.
+            try:
+                api_client.flush_logs()
+            except Exception:
+                pass
             with open(p, 'w', encoding='utf-8'):
                 pass
             QtWidgets.QMessageBox.information(self, "Reset Log", f"Truncated {p}")
@@ -1424,6 +1435,12 @@ class MainWindow(QtWidgets.QMainWindow):
         logs = [getattr(api_client, 'LOG_FILE', Path('api_calls.log')), getattr(api_client, 'CONNECTION_LOG', Path('connection_errors.log')), getattr(api_client, 'CREDENTIALS_LOG', Path('credentials.log'))]
         if QtWidgets.QMessageBox.question(self, "Clear All Logs", "Truncate all known log files? This cannot be undone.") != QtWidgets.QMessageBox.Yes:
             return
+        # Drain buffers so pending records are not flushed into the
+        # freshly truncated files later.
+        try:
+            api_client.flush_logs()
+        except Exception:
+            pass
         errs = []
         for p in logs:
             try:
@@ -1441,6 +1458,11 @@ class MainWindow(QtWidgets.QMainWindow):
 
         The archive is written to the selected directory. Originals are left in place.
         """
+        # Flush buffered records first so the archive captures everything
+        try:
+            api_client.flush_logs()
+        except Exception:
+            pass
         logs = [getattr(api_client, 'LOG_FILE', Path('api_calls.log')), getattr(api_client, 'CONNECTION_LOG', Path('connection_errors.log')), getattr(api_client, 'CREDENTIALS_LOG', Path('credentials.log'))]
         existing = [p for p in logs if Path(p).exists()]
         if not existing:
@@ -1452,13 +1474,20 @@ class MainWindow(QtWidgets.QMainWindow):
         )
         if not dest_dir:
             return
+        import zipfile
+        import shutil
         ts = datetime.utcnow().strftime('%Y%m%dT%H%M%SZ')
         archive_name = Path(dest_dir) / f"logs_archive_{ts}.zip"
         try:
-            with zipfile.ZipFile(archive_name, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+            # Stream each log into the archive in 64 KB chunks instead of
+            # zf.write's whole-file reads; compresslevel=1 is several times
+            # faster than the default and log text still compresses well.
+            with zipfile.ZipFile(archive_name, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
                 for p in existing:
                     try:
-                        zf.write(str(p), arcname=Path(p).name)
+                        with open(p, 'rb', buffering=1 << 16) as src, \
+                                zf.open(Path(p).name, 'w', force_zip64=True) as dst:
+                            shutil.copyfileobj(src, dst, length=1 << 16)
                     except Exception:
                         pass
             # Ask whether to rotate (truncate) originals after archiving
@@ -1536,6 +1565,7 @@ class MainWindow(QtWidgets.QMainWindow):
     def toggle_friendly_names(self):
         """Toggle between friendly names and attribute names for columns."""
         self.use_friendly_names = self.use_friendly_names_action.isChecked()
+        self._recompute_headers()
         self.refresh_table_headers()
 
     def toggle_theme(self):
@@ -1584,9 +1614,22 @@ class MainWindow(QtWidgets.QMainWindow):
         except Exception:
             pass
 
+    def _recompute_headers(self):
+        """Rebuild the cached header labels and column-index map.
+
+        Called whenever `self.columns` or the friendly-name setting
+        changes, so per-row and per-click code can use these lookups
+        instead of resolving labels or scanning for indices each time.
+        """
+        self._col_index = {c: i for i, c in enumerate(self.columns)}
+        if self.use_friendly_names:
+            self._header_labels = [self.friendly_names.get(col, col) for col in self.columns]
+        else:
+            self._header_labels = list(self.columns)
+
     def _get_column_labels(self):
         """Get column labels based on friendly name setting."""
-        return [self.friendly_names.get(col, col) for col in self.columns] if self.use_friendly_names else self.columns
+        return self._header_labels
 
     def _flatten_user(self, user: dict) -> dict:
         """Return a flat dict of user attributes using dot-notation keys."""
@@ -1628,7 +1671,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def update_user_field(self, user_id, col_name, new_data):
         """Update a specific field of a user via API."""
-        user = next((u for u in self.users_cache if u['id'] == user_id), None)
+        user = self._users_by_id.get(user_id)
         if user:
             user[col_name] = new_data
             client = api_client.PingOneClient(self.env_id.text(), self.cl_id.text(), self.cl_sec.text())
@@ -1641,14 +1684,14 @@ class MainWindow(QtWidgets.QMainWindow):
             self.threadpool.start(worker)
 
     def show_config_help(self):
-        QtWidgets.QMessageBox.information(self, "Configuration Help", HELP_CONFIG)
+        QtWidgets.QMessageBox.information(self, "Configuration Help", _help('config'))
 
     def show_user_help(self):
-        QtWidgets.QMessageBox.information(self, "User Management Help", HELP_USER)
+        QtWidgets.QMessageBox.information(self, "User Management Help", _help('user'))
 
     def show_full_help(self):
         """Show comprehensive help covering all UI options and configuration."""
-        combined = f"{HELP_CONFIG}\n\n{HELP_USER}"
+        combined = f"{_help('config')}\n\n{_help('user')}"
         QtWidgets.QMessageBox.information(self, "Full Help & Options", combined)
 
     def show_tabs_help(self):
@@ -1680,9 +1723,9 @@ See Configuration Help and User Management Help from the Help menu for detailed
                 with open(readme, 'r', encoding='utf-8') as f:
                     content = f.read()
             else:
-                content = f"{HELP_CONFIG}\n\n{HELP_USER}"
+                content = f"{_help('config')}\n\n{_help('user')}"
         except Exception as e:
-            content = f"Failed to load README.md: {e}\n\nFallback help:\n{HELP_CONFIG}\n\n{HELP_USER}"
+            content = f"Failed to load README.md: {e}\n\nFallback help:\n{_help('config')}\n\n{_help('user')}"
 
         dlg = QtWidgets.QDialog(self)
         dlg.setWindowTitle('Application Help')
@@ -1773,12 +1816,12 @@ See Configuration Help and User Management Help from the Help menu for detailed
             pass
 
         selected = self.u_table.selectionModel().selectedRows()
-        # Show options dialog so user can choose selected/all and visible/all columns
+        # Resolve options; remembered profile choices skip the dialog entirely
         from ui.dialogs import ExportOptionsDialog
-        dlg = ExportOptionsDialog(bool(selected), only_visible_default, prefer_selected, self)
-        if dlg.exec() != QtWidgets.QDialog.Accepted:
+        opts = ExportOptionsDialog.get_or_remembered(
+            prof_name, bool(selected), only_visible_default, prefer_selected, self)
+        if opts is None:
             return
-        opts = dlg.get_options()
         # persist choices if requested
         if opts.get('remember') and prof_name:
             try:
@@ -1787,8 +1830,7 @@ See Configuration Help and User Management Help from the Help menu for detailed
                     cfg[prof_name] = {}
                 cfg[prof_name]['export_prefer_selected'] = (opts.get('rows') == 'selected')
                 cfg[prof_name]['export_only_visible_columns'] = bool(opts.get('only_visible_columns'))
-                with open(self.config_file, 'w') as f:
-                    json.dump(cfg, f, indent=4)
+                self._write_config(cfg)
             except Exception:
                 pass
 
@@ -1801,7 +1843,7 @@ See Configuration Help and User Management Help from the Help menu for detailed
         # compute export users
         try:
             if opts.get('rows') == 'selected' and selected:
-                id_col = self.columns.index('id') if 'id' in self.columns else -1
+                id_col = self._col_index.get('id', -1)
                 if id_col != -1:
                     ids = [self.u_table.item(r.row(), id_col).text() for r in selected]
                     export_users = [u for u in self.users_cache if u.get('id') in ids]
@@ -1810,7 +1852,8 @@ See Configuration Help and User Management Help from the Help menu for detailed
                     for r in selected:
                         try:
                             val = self.u_table.item(r.row(), 0).text()
-                            found = next((u for u in self.users_cache if u.get('username') == val or u.get('id') == val), None)
+                            found = self._users_by_id.get(val) or next(
+                                (u for u in self.users_cache if u.get('username') == val), None)
                             if found:
                                 export_users.append(found)
                         except Exception:
@@ -1858,10 +1901,10 @@ See Configuration Help and User Management Help from the Help menu for detailed
 
         selected = self.u_table.selectionModel().selectedRows()
         from ui.dialogs import ExportOptionsDialog
-        dlg = ExportOptionsDialog(bool(selected), only_visible_default, prefer_selected, self)
-        if dlg.exec() != QtWidgets.QDialog.Accepted:
+        opts = ExportOptionsDialog.get_or_remembered(
+            prof_name, bool(selected), only_visible_default, prefer_selected, self)
+        if opts is None:
             return
-        opts = dlg.get_options()
         if opts.get('remember') and prof_name:
             try:
                 cfg = self._read_config()
@@ -1869,8 +1912,7 @@ See Configuration Help and User Management Help from the Help menu for detailed
                     cfg[prof_name] = {}
                 cfg[prof_name]['export_prefer_selected'] = (opts.get('rows') == 'selected')
                 cfg[prof_name]['export_only_visible_columns'] = bool(opts.get('only_visible_columns'))
-                with open(self.config_file, 'w') as f:
-                    json.dump(cfg, f, indent=4)
+                self._write_config(cfg)
             except Exception:
                 pass
 
@@ -1881,7 +1923,7 @@ See Configuration Help and User Management Help from the Help menu for detailed
 
         try:
             if opts.get('rows') == 'selected' and selected:
-                id_col = self.columns.index('id') if 'id' in self.columns else -1
+                id_col = self._col_index.get('id', -1)
                 if id_col != -1:
                     ids = [self.u_table.item(r.row(), id_col).text() for r in selected]
                     export_users = [u for u in self.users_cache if u.get('id') in ids]
@@ -1890,7 +1932,8 @@ See Configuration Help and User Management Help from the Help menu for detailed
                     for r in selected:
                         try:
                             val = self.u_table.item(r.row(), 0).text()
-                            found = next((u for u in self.users_cache if u.get('username') == val or u.get('id') == val), None)
+                            found = self._users_by_id.get(val) or next(
+                                (u for u in self.users_cache if u.get('username') == val), None)
                             if found:
                                 export_users.append(found)
                         except Exception:
@@ -2046,8 +2089,7 @@ See Configuration Help and User Management Help from the Help menu for detailed
                         cfg[prof_name]['mappings'] = mapping
                         cfg[prof_name]['fixed_population_id'] = fixed_pop_id
                         cfg[prof_name]['fixed_enabled'] = fixed_enabled
-                        with open(self.config_file, 'w') as f:
-                            json.dump(cfg, f, indent=4)
+                        self._write_config(cfg)
                 except Exception:
                     pass
                 for row in reader:
@@ -2412,8 +2454,7 @@ See Configuration Help and User Management Help from the Help menu for detailed
                     cfg[prof_name]['mappings'] = mapping
                     cfg[prof_name]['fixed_population_id'] = fixed_pop_id
                     cfg[prof_name]['fixed_enabled'] = fixed_enabled
-                    with open(self.config_file, 'w') as f:
-                        json.dump(cfg, f, indent=4)
+                    self._write_config(cfg)
             except Exception:
                 pass
             for ent in entries:
@@ -2798,8 +2839,7 @@ See Configuration Help and User Management Help from the Help menu for detailed
         p = self._read_config()
         if name in p:
             p[name]["columns"] = self.selected_columns
-            with open(self.config_file, 'w') as f:
-                json.dump(p, f, indent=4)
+            self._write_config(p)
             if show_notification:
                 msg = f"Column layout saved for profile '{name}'"
                 self.status_label.setText(msg)
@@ -2830,6 +2870,7 @@ See Configuration Help and User Management Help from the Help menu for detailed
 
     def view_connection_log(self):
         try:
+            api_client.flush_logs()
             if not self.connection_log_path.exists():
                 QtWidgets.QMessageBox.information(self, "Connection Log", "No connection log entries yet.")
                 return
@@ -2854,22 +2895,32 @@ See Configuration Help and User Management Help from the Help menu for detailed
         
         # Filter columns to only those present in dataset
         self.columns = [c for c in self.selected_columns if c in self.all_columns]
-        
-        # Disable sorting during table rebuild for better performance
+        self._recompute_headers()
+
+        # Disable sorting, repaints and per-item signals during the rebuild
+        # so Qt processes the whole batch in one pass instead of reacting
+        # to every setItem call.
         self.u_table.setSortingEnabled(False)
-        self.u_table.setColumnCount(len(self.columns))
-        self.u_table.setHorizontalHeaderLabels(self._get_column_labels())
-        self.u_table.setRowCount(len(self.users_cache))
-        
-        # Populate table rows
-        for row_idx, user in enumerate(self.users_cache):
-            for col_idx, col in enumerate(self.columns):
-                value = self._get_value(user, col)
-                item = QtWidgets.QTableWidgetItem(str(value))
-                item.setData(QtCore.Qt.UserRole, value)
-                self.u_table.setItem(row_idx, col_idx, item)
-        
-        self.u_table.setSortingEnabled(True)
+        self.u_table.setUpdatesEnabled(False)
+        self.u_table.blockSignals(True)
+        try:
+            self.u_table.setColumnCount(len(self.columns))
+            self.u_table.setHorizontalHeaderLabels(self._get_column_labels())
+            self.u_table.setRowCount(len(self.users_cache))
+
+            # Populate table rows
+            for row_idx, user in enumerate(self.users_cache):
+                for col_idx, col in enumerate(self.columns):
+                    value = self._get_value(user, col)
+                    item = self._item_proto.clone()
+                    item.setText(str(value))
+                    item.setData(QtCore.Qt.UserRole, value)
+                    self.u_table.setItem(row_idx, col_idx, item)
+        finally:
+            self.u_table.blockSignals(False)
+            self.u_table.setUpdatesEnabled(True)
+            self.u_table.setSortingEnabled(True)
+        self._invalidate_filter_index()
         self._apply_column_widths()
 
     def on_item_double_clicked(self, item):
@@ -2877,7 +2928,7 @@ See Configuration Help and User Management Help from the Help menu for detailed
         row = item.row()
         col = item.column()
         col_name = self.columns[col]
-        id_col = self.columns.index('id') if 'id' in self.columns else -1
+        id_col = self._col_index.get('id', -1)
         if id_col == -1: return
         user_id = self.u_table.item(row, id_col).text()
         # Only open editor when double-clicking the UUID or username columns
@@ -2913,7 +2964,7 @@ See Configuration Help and User Management Help from the Help menu for detailed
 
         # For name/address columns, prefer nested object from user cache
         if col_name in ['name', 'address']:
-            user_obj = next((u for u in self.users_cache if u.get('id') == user_id), None)
+            user_obj = self._users_by_id.get(user_id)
             if user_obj:
                 nested = user_obj.get(col_name, {})
                 if isinstance(nested, (dict, list)):
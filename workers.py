@@ -148,36 +148,45 @@ class BulkDeleteWorker(QtCore.QRunnable):
             self.signals.error.emit("Auth Failed. Check credentials.")
             return
         headers = self.client._get_auth_headers(token)
+        total = len(self.user_ids)
         success = 0
+        done = 0
+        # Deletes are independent, so run them concurrently; the
+        # semaphore bounds in-flight requests to keep server load
+        # predictable while still overlapping the network waits.
+        sem = asyncio.Semaphore(16)
         # Use a short-lived AsyncClient for deletes to avoid sharing
         async with httpx.AsyncClient(timeout=10.0) as session:
-            # Iterate user IDs and perform DELETE requests one-by-one.
-            # This keeps load predictable and allows progress reporting.
-            for i, uid in enumerate(self.user_ids):
+            async def _delete_one(uid):
+                nonlocal success, done
                 delete_url = f"{self.client.base_url}/users/{uid}"
-                try:
-                    if api_client.API_LOGGING_ENABLED:
-                        api_client.api_logger.info(f"DELETE {delete_url}")
-                        try:
-                            api_client.append_live_event(f"DELETE {delete_url}")
-                        except Exception:
-                            pass
-                    resp = await session.delete(delete_url, headers=headers)
-                    if api_client.API_LOGGING_ENABLED:
-                        api_client.api_logger.info(f"DELETE {delete_url} - Status: {resp.status_code}")
-                        try:
-                            api_client.write_connection_log(f"DELETE {delete_url} - {resp.status_code}")
-                        except Exception:
-                            pass
-                    success += 1
-                except Exception as e:
-                    if api_client.API_LOGGING_ENABLED:
-                        api_client.api_logger.error(f"DELETE {delete_url} - Failed: {str(e)}")
-                        try:
-                            api_client.write_connection_log(f"DELETE {delete_url} - ERROR - {str(e)}")
-                        except Exception:
-                            pass
-                self.signals.progress.emit(i + 1, len(self.user_ids))
+                async with sem:
+                    try:
+                        if api_client.API_LOGGING_ENABLED:
+                            api_client.api_logger.info(f"DELETE {delete_url}")
+                            try:
+                                api_client.append_live_event(f"DELETE {delete_url}")
+                            except Exception:
+                                pass
+                        resp = await session.delete(delete_url, headers=headers)
+                        if api_client.API_LOGGING_ENABLED:
+                            api_client.api_logger.info(f"DELETE {delete_url} - Status: {resp.status_code}")
+                            try:
+                                api_client.write_connection_log(f"DELETE {delete_url} - {resp.status_code}")
+                            except Exception:
+                                pass
+                        success += 1
+                    except Exception as e:
+                        if api_client.API_LOGGING_ENABLED:
+                            api_client.api_logger.error(f"DELETE {delete_url} - Failed: {str(e)}")
+                            try:
+                                api_client.write_connection_log(f"DELETE {delete_url} - ERROR - {str(e)}")
+                            except Exception:
+                                pass
+                done += 1
+                self.signals.progress.emit(done, total)
+
+            await asyncio.gather(*(_delete_one(uid) for uid in self.user_ids))
         if api_client.API_LOGGING_ENABLED:
             api_client.api_logger.info(f"Bulk delete completed: {success}/{len(self.user_ids)} users deleted")
             try:
@@ -319,9 +328,15 @@ class BulkUpdateWorker(QtCore.QRunnable):
             return
         total = len(self.user_pairs)
         updated = 0
+        done = 0
         errors = []
-        async with httpx.AsyncClient(timeout=10.0) as session:
-            for i, (uid, data) in enumerate(self.user_pairs):
+        # Updates target distinct users, so overlap them the same way as
+        # bulk deletes: concurrent requests bounded by a semaphore.
+        sem = asyncio.Semaphore(16)
+
+        async def _update_one(uid, data):
+            nonlocal updated, done
+            async with sem:
                 try:
                     if api_client.API_LOGGING_ENABLED:
                         api_client.api_logger.info(f"Updating user: {uid}")
@@ -344,7 +359,10 @@ class BulkUpdateWorker(QtCore.QRunnable):
                             api_client.write_connection_log(f"Update user ERROR - {err_msg}")
                         except Exception:
                             pass
-                self.signals.progress.emit(i + 1, total)
+            done += 1
+            self.signals.progress.emit(done, total)
+
+        await asyncio.gather(*(_update_one(uid, data) for uid, data in self.user_pairs))
 
         if api_client.API_LOGGING_ENABLED:
             api_client.api_logger.info(f"Bulk update completed: {updated}/{total} users updated")